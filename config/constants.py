@@ -172,6 +172,13 @@ SAFE_MESSAGE_LENGTH = 4000  # Leave some buffer
 DEFAULT_CACHE_TTL_SECONDS = 3600  # 1 hour
 DEFAULT_CLASSIFICATION_CACHE_SIZE = 1000
 DEFAULT_LINKS_CACHE_SIZE = 500
+CLASSIFICATION_CACHE_TTL_SECONDS = 300  # 5 minutes
+CLASSIFICATION_FAILURE_CACHE_SIZE = 200
+CLASSIFICATION_FAILURE_CACHE_TTL_SECONDS = 30  # Short-lived to retry transient LLM errors
+
+# LLM classification output
+CLASSIFICATION_MAX_TOKENS = 64  # The four-field JSON answer fits comfortably
+OLLAMA_CONNECT_TIMEOUT_SECONDS = 5  # Fail fast when the Ollama server is unreachable
 
 # Input validation
 MIN_MESSAGE_LENGTH = 3
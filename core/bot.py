@@ -172,6 +172,9 @@ class PAstaLinkBot(LoggerMixin):
             # Log startup information
             self._log_startup_info()
 
+            # Load the LLM and its system prompt before the first message arrives
+            self.classification_service.warm_up()
+
             # Start polling
             self.logger.info("Starting bot polling...")
             self.application.run_polling(
@@ -18,12 +18,7 @@ from telegram.ext import CommandHandler, ContextTypes
 from core.services.catalog import CatalogService
 from core.services.formatter import ResponseFormatterService
 from core.services.validator import InputValidationService
-from utils.decorators import (
-    handle_telegram_errors,
-    log_handler_call,
-    require_admin,
-    validate_update,
-)
+from utils.decorators import require_admin, telegram_handler
 from utils.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
@@ -68,9 +63,7 @@ class CommandHandlers(LoggerMixin):
     def _create_start_wrapper(self):
         """Create decorated wrapper for start command."""
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             return await self._start_command(update, context)
 
@@ -79,9 +72,7 @@ class CommandHandlers(LoggerMixin):
     def _create_help_wrapper(self):
         """Create decorated wrapper for help command."""
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             return await self._help_command(update, context)
 
@@ -90,9 +81,7 @@ class CommandHandlers(LoggerMixin):
     def _create_about_wrapper(self):
         """Create decorated wrapper for about command."""
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             return await self._about_command(update, context)
 
@@ -101,9 +90,7 @@ class CommandHandlers(LoggerMixin):
     def _create_stats_wrapper(self):
         """Create decorated wrapper for stats command."""
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         @require_admin(admin_user_ids=lambda self: self.admin_user_ids)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             return await self._stats_command(update, context)
@@ -113,9 +100,7 @@ class CommandHandlers(LoggerMixin):
     def _create_regions_wrapper(self):
         """Create decorated wrapper for regions command."""
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             return await self._regions_command(update, context)
 
@@ -237,8 +222,8 @@ class CommandHandlers(LoggerMixin):
         user_language = update.effective_user.language_code if update.effective_user else None
 
         try:
-            # Get regions from catalog service
-            regions = self.catalog_service.get_regions()
+            # Get regions, already sorted, from validation service
+            regions = self.validation_service.sorted_regions
 
             # Format response
             response = self.formatter_service.format_regions_list(regions, user_language)
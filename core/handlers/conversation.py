@@ -19,7 +19,7 @@ from core.models.intent import ClassificationResult, IntentRequest
 from core.services.catalog import CatalogService
 from core.services.formatter import ResponseFormatterService
 from core.services.validator import InputValidationService
-from utils.decorators import handle_telegram_errors, log_handler_call, validate_update
+from utils.decorators import telegram_handler
 from utils.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
@@ -63,9 +63,7 @@ class ConversationHandlers(LoggerMixin):
         This creates a function that can be called by Telegram without 'self'.
         """
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             """
             Standalone wrapper function for handle_region_selection with decorators.
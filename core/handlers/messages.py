@@ -27,7 +27,7 @@ from core.services.catalog import CatalogService
 from core.services.classifier import ClassificationService
 from core.services.formatter import ResponseFormatterService
 from core.services.validator import InputValidationService
-from utils.decorators import handle_telegram_errors, log_handler_call, validate_update
+from utils.decorators import telegram_handler
 from utils.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
@@ -74,9 +74,7 @@ class MessageHandlers(LoggerMixin):
         This creates a function that can be called by Telegram without 'self'.
         """
 
-        @handle_telegram_errors
-        @log_handler_call
-        @validate_update
+        @telegram_handler
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Optional[int]:
             """
             Standalone wrapper function for handle_message with decorators.
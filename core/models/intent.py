@@ -11,6 +11,7 @@ Classes:
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from config.constants import IntentType
@@ -226,7 +227,7 @@ class CatalogEntry:
 
     def _validate_url(self) -> None:
         """Basic URL validation."""
-        if not (self.url.startswith("http://") or self.url.startswith("https://")):
+        if not self.url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL format: {self.url}")
 
     def _normalize_data(self) -> None:
@@ -247,6 +248,11 @@ class CatalogEntry:
         """Check if this is a national-level service."""
         return self.region.lower() in ["nazionale", "national"]
 
+    @cached_property
+    def formatted_line(self) -> str:
+        """Get the bullet line used to show this entry in link responses."""
+        return f"• {self.label}: {self.url}" if self.url else ""
+
     def matches_request(self, intent: str, region: Optional[str] = None) -> bool:
         """
         Check if this entry matches a request.
@@ -14,7 +14,7 @@ import logging
 from collections import defaultdict
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from config.constants import NATIONAL_REGION
 from core.models.intent import CatalogEntry, IntentStats
@@ -48,6 +48,34 @@ class CatalogService(LoggerMixin):
 
         self._load_catalog()
 
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[CatalogEntry],
+        max_links_per_response: int = 6,
+        data_path: str = "",
+    ) -> "CatalogService":
+        """
+        Create a catalog service from already validated entries, without reading a file.
+
+        Args:
+            entries: Catalog entries to index
+            max_links_per_response: Maximum links to return per query
+            data_path: Optional catalog file path, only used by reload_catalog
+
+        Returns:
+            CatalogService: Service indexed over the given entries
+        """
+        service = cls.__new__(cls)
+        service.data_path = Path(data_path)
+        service.max_links_per_response = max_links_per_response
+        service.entries = list(entries)
+        service.index = None
+        service.stats = {}
+
+        service._build_index()
+        return service
+
     def _load_catalog(self) -> None:
         """Load and validate catalog from JSON file."""
         with log_performance("load_catalog", self.logger):
@@ -137,16 +165,14 @@ class CatalogService(LoggerMixin):
 
         try:
             # Get entries from index
-            entries_tuple = self.index.get_entries(intent, region)
-            entries_list = list(entries_tuple)
+            entries = self.index.get_entries(intent, region)
 
             # Apply fallback logic if no region-specific results
-            if not entries_list and region:
-                entries_tuple = self.index.get_entries(intent, None)
-                entries_list = list(entries_tuple)
+            if not entries and region:
+                entries = self.index.get_entries(intent, None)
 
-            # Limit results
-            limited_entries = entries_list[: self.max_links_per_response]
+            # Limit results, copying only the entries that are returned
+            limited_entries = list(entries[: self.max_links_per_response])
 
             # Update statistics
             self._update_stats(intent, len(limited_entries) > 0, region)
@@ -290,7 +316,7 @@ class CatalogService(LoggerMixin):
             # Check URL accessibility (basic validation)
             invalid_urls = []
             for entry in self.entries:
-                if not (entry.url.startswith("http://") or entry.url.startswith("https://")):
+                if not entry.url.startswith(("http://", "https://")):
                     invalid_urls.append(entry.url)
 
             if invalid_urls:
@@ -332,9 +358,9 @@ class CatalogIndex(LoggerMixin):
             entries: List of catalog entries to index
         """
         self.entries = entries
-        self.intent_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
-        self.region_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
-        self.intent_region_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
+        self.intent_index: Dict[str, Tuple[CatalogEntry, ...]] = {}
+        self.region_index: Dict[str, Tuple[CatalogEntry, ...]] = {}
+        self.intent_region_index: Dict[str, Tuple[CatalogEntry, ...]] = {}
         self.regions: Set[str] = set()
         self.intents: Set[str] = set()
 
@@ -342,31 +368,40 @@ class CatalogIndex(LoggerMixin):
 
     def _build_indexes(self) -> None:
         """Build search indexes for fast lookups."""
+        # Entries come from CatalogService._validate_and_convert_entries, which
+        # only yields CatalogEntry objects, so the type is checked once up front
+        assert all(isinstance(e, CatalogEntry) for e in self.entries), "Invalid entry type"
+
         with log_performance("build_catalog_indexes", self.logger):
             try:
-                for entry in self.entries:
-                    if not isinstance(entry, CatalogEntry):
-                        self.logger.warning(f"Invalid entry type: {type(entry)}")
-                        continue
+                intent_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
+                region_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
+                intent_region_index: Dict[str, List[CatalogEntry]] = defaultdict(list)
 
+                for entry in self.entries:
                     intent = entry.intent
                     region = entry.region
 
                     # Intent-only index
                     if intent:
-                        self.intent_index[intent].append(entry)
+                        intent_index[intent].append(entry)
                         self.intents.add(intent)
 
                     # Region-only index
                     if region:
-                        self.region_index[region].append(entry)
+                        region_index[region].append(entry)
                         if region != NATIONAL_REGION:
                             self.regions.add(region)
 
                     # Combined intent+region index for fastest lookups
                     if intent and region:
                         key = self._make_combined_key(intent, region)
-                        self.intent_region_index[key].append(entry)
+                        intent_region_index[key].append(entry)
+
+                # Freeze the buckets so lookups can hand them out without copying
+                self.intent_index = {k: tuple(v) for k, v in intent_index.items()}
+                self.region_index = {k: tuple(v) for k, v in region_index.items()}
+                self.intent_region_index = {k: tuple(v) for k, v in intent_region_index.items()}
 
                 self.logger.info(
                     f"Built catalog indexes: {len(self.intent_index)} intents, "
@@ -403,12 +438,12 @@ class CatalogIndex(LoggerMixin):
             if region:
                 key = self._make_combined_key(intent, region)
                 if key in self.intent_region_index:
-                    return tuple(self.intent_region_index[key])
+                    return self.intent_region_index[key]
 
             # Try national fallback
             national_key = self._make_combined_key(intent, NATIONAL_REGION)
             if national_key in self.intent_region_index:
-                return tuple(self.intent_region_index[national_key])
+                return self.intent_region_index[national_key]
 
             # Last resort: filter intent-only index
             if intent in self.intent_index:
@@ -9,23 +9,47 @@ Classes:
 """
 
 import asyncio
-import json
+import concurrent.futures
 import logging
 import os
-from functools import lru_cache
-from typing import Any, Dict, Generator, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Optional, Union
 
 import requests
 from dotenv import load_dotenv
-
+from requests.adapters import HTTPAdapter
+
+from config.constants import (
+    CLASSIFICATION_CACHE_TTL_SECONDS,
+    CLASSIFICATION_FAILURE_CACHE_SIZE,
+    CLASSIFICATION_FAILURE_CACHE_TTL_SECONDS,
+    CLASSIFICATION_MAX_TOKENS,
+    OLLAMA_CONNECT_TIMEOUT_SECONDS,
+)
 from core.models.intent import ClassificationResult
 from utils.decorators import retry
+from utils.helpers import TTLCache, json_dumps, json_loads
 from utils.logging import LoggerMixin, log_performance
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Whole-message trigger phrases that map to a single intent without asking the LLM.
+# They mirror the rules in the system prompt and only match when the message is
+# nothing but the phrase (plus punctuation), so "ciao, bollo auto?" still goes to the LLM.
+_FAST_INTENT_RULES = tuple(
+    (re.compile(rf"(?:{phrases})[\s!?.,]*", re.IGNORECASE), intent)
+    for phrases, intent in (
+        (r"ciao|salve|hey|buongiorno|buonasera", "greeting"),
+        (r"aiuto|help|cosa sai fare|come funzioni", "help"),
+        (r"chi sei|chi ti ha creato|info bot", "about"),
+        (r"come va|come stai", "smalltalk"),
+    )
+)
+
 
 class ClassificationService(LoggerMixin):
     """
@@ -41,6 +65,7 @@ class ClassificationService(LoggerMixin):
         model: Optional[str] = None,
         cache_size: int = 1000,
         timeout: int = 30,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize classification service.
@@ -50,16 +75,50 @@ class ClassificationService(LoggerMixin):
             model: Model name to use
             cache_size: LRU cache size for classifications
             timeout: Request timeout in seconds
+            max_concurrency: Maximum concurrent LLM requests, defaults to the
+                OLLAMA_NUM_PARALLEL environment variable (or 4)
         """
         self.ollama_host = ollama_host or os.getenv("OLLAMA_HOST", "http://localhost:11434")
         self.model = model or os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+        self._chat_url = f"{self.ollama_host.rstrip('/')}/api/chat"
         self.timeout = timeout
+        self._request_timeout = (OLLAMA_CONNECT_TIMEOUT_SECONDS, timeout)
+        self.max_concurrency = max_concurrency or int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+        # How long Ollama keeps the model, and the system prompt's KV cache, loaded
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
+        # Configure caching: successes live longer, failures only briefly so
+        # pathological inputs don't burn the full timeout on every retry
+        self._success_cache = TTLCache(
+            maxsize=cache_size, ttl_seconds=CLASSIFICATION_CACHE_TTL_SECONDS
+        )
+        self._failure_cache = TTLCache(
+            maxsize=CLASSIFICATION_FAILURE_CACHE_SIZE,
+            ttl_seconds=CLASSIFICATION_FAILURE_CACHE_TTL_SECONDS,
+        )
+
+        # Dedicated workers for blocking LLM calls, matched to the server's parallelism
+        # so requests overlap without starving the default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="classifier"
+        )
+
+        # Pooled HTTP session, so LLM requests reuse keep-alive connections to Ollama;
+        # created on first request so services that never call the LLM don't build one
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
 
-        # Configure caching
-        self._cached_classify = lru_cache(maxsize=cache_size)(self._classify_internal)
+        # In-flight classifications, so concurrent identical requests share one LLM call
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        # Background event loop for classify_sync, started lazily
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
         # System prompt for classification
         self.system_prompt = self._build_system_prompt()
+        self._build_payload_template()
 
         self.logger.info(f"Classification service initialized with model: {self.model}")
 
@@ -104,63 +163,90 @@ class ClassificationService(LoggerMixin):
             'A: {"intent":"fascicolo_sanitario", "region":null, "confidence":0.9, "needs_region":true}\n'
         )
 
+    def _build_payload_template(self) -> None:
+        """
+        Pre-serialize the classification request body around the user message.
+
+        Only the user message changes between requests, so the model, system
+        prompt and options are encoded once and the message is spliced in.
+        """
+        placeholder = "\x00user\x00"
+        body = json_dumps(
+            {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": placeholder},
+                ],
+                "stream": False,
+                "format": "json",
+                "options": {"temperature": 0.0, "num_predict": CLASSIFICATION_MAX_TOKENS},
+                "keep_alive": self.keep_alive,
+            }
+        )
+        prefix, suffix = body.split(json_dumps(placeholder))
+        self._payload_prefix = prefix.encode()
+        self._payload_suffix = suffix.encode()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the pooled HTTP session for Ollama, creating it on first use."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session with a connection pool sized for concurrent requests.
+
+        Returns:
+            requests.Session: Session for Ollama API calls
+        """
+        session = requests.Session()
+        # Block for a free pooled connection instead of opening throwaway extra ones
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_concurrency, pool_block=True
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     @retry(max_attempts=3, delay_seconds=1.0, exceptions=(requests.RequestException,))
-    def _post_chat(self, payload: Dict[str, Any], stream: bool = False):
+    def _post_chat(self, payload: Union[Dict[str, Any], bytes], stream: bool = False):
         """Make HTTP request to Ollama API with retry logic."""
-        url = f"{self.ollama_host}/api/chat"
+        # Pre-serialized bodies are sent as-is instead of being re-encoded
+        if isinstance(payload, bytes):
+            kwargs = {"data": payload, "headers": {"Content-Type": "application/json"}}
+        else:
+            kwargs = {"json": payload}
 
         if stream:
-            return requests.post(url, json=payload, stream=True, timeout=self.timeout)
-        return requests.post(url, json=payload, timeout=self.timeout)
+            return self.session.post(
+                self._chat_url, stream=True, timeout=self._request_timeout, **kwargs
+            )
+        return self.session.post(self._chat_url, timeout=self._request_timeout, **kwargs)
 
-    def _classify_internal(self, text_hash: str, text: str) -> str:
+    def _cached_classify(self, cache_key: str, text: str) -> str:
         """
-        Internal classification method for caching.
+        Classify text through the success and failure caches.
 
         Args:
-            text_hash: Hash of the text for caching
+            cache_key: Normalized text used as the cache key
             text: Original text to classify
 
         Returns:
             str: JSON string of classification result
         """
-        payload = {
-            "model": self.model,
-            "messages": [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": text},
-            ],
-            "stream": False,
-            "options": {"temperature": 0.0},
-        }
+        result_json = self._success_cache.get(cache_key)
+        if result_json is None:
+            result_json = self._failure_cache.get(cache_key)
+        if result_json is not None:
+            return result_json
 
         try:
-            with log_performance(f"llm_classification", self.logger):
-                response = self._post_chat(payload, stream=False)
-                response.raise_for_status()
-
-                content = response.json()["message"]["content"].strip()
-
-                # Extract JSON from response
-                start = content.find("{")
-                end = content.rfind("}")
-
-                if start == -1 or end == -1:
-                    raise ValueError("No JSON found in LLM response")
-
-                json_str = content[start : end + 1]
-
-                # Validate JSON
-                data = json.loads(json_str)
-
-                # Ensure required fields
-                data.setdefault("intent", "unknown")
-                data.setdefault("region", None)
-                data.setdefault("confidence", 0.0)
-                data.setdefault("needs_region", False)
-
-                return json.dumps(data)
-
+            result_json = self._classify_internal(cache_key, text)
         except Exception as e:
             self.logger.error(f"LLM classification failed: {e}")
             # Return default classification
@@ -170,7 +256,77 @@ class ClassificationService(LoggerMixin):
                 "confidence": 0.0,
                 "needs_region": False,
             }
-            return json.dumps(default_result)
+            result_json = json_dumps(default_result)
+            self._failure_cache.set(cache_key, result_json)
+            return result_json
+
+        self._success_cache.set(cache_key, result_json)
+        return result_json
+
+    def _classify_internal(self, cache_key: str, text: str) -> str:
+        """
+        Internal classification method for caching.
+
+        Args:
+            cache_key: Normalized text used as the cache key
+            text: Original text to classify
+
+        Returns:
+            str: JSON string of classification result
+
+        Raises:
+            Exception: If the LLM request fails or returns no valid JSON
+        """
+        payload = self._payload_prefix + json_dumps(text).encode() + self._payload_suffix
+
+        with log_performance("llm_classification", self.logger):
+            response = self._post_chat(payload, stream=False)
+            response.raise_for_status()
+
+            # JSON mode constrains decoding, so the content is a JSON document
+            data = json_loads(json_loads(response.content)["message"]["content"])
+            if not isinstance(data, dict):
+                raise ValueError("LLM response is not a JSON object")
+
+            # Ensure required fields
+            data.setdefault("intent", "unknown")
+            data.setdefault("region", None)
+            data.setdefault("confidence", 0.0)
+            data.setdefault("needs_region", False)
+
+            return json_dumps(data)
+
+    async def _classify_single_flight(self, cache_key: str, text: str) -> str:
+        """
+        Run a cached classification, coalescing concurrent identical requests.
+
+        The cache is only populated once the HTTP call completes, so identical
+        messages arriving together would each hit Ollama. Instead, the first caller
+        starts the work and any concurrent caller awaits the same future.
+
+        Args:
+            cache_key: Normalized text used as the cache key
+            text: Original text to classify
+
+        Returns:
+            str: JSON string of classification result
+        """
+        loop = asyncio.get_running_loop()
+
+        # Futures can only be awaited on their own loop (sync callers use a background one)
+        pending = self._pending.get(cache_key)
+        if pending is not None and pending.get_loop() is loop:
+            return await asyncio.shield(pending)
+
+        # Run classification in thread pool to avoid blocking
+        future = loop.run_in_executor(self._executor, self._cached_classify, cache_key, text)
+        self._pending[cache_key] = future
+
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._pending.get(cache_key) is future:
+                del self._pending[cache_key]
 
     async def classify_async(self, text: str) -> ClassificationResult:
         """
@@ -188,15 +344,19 @@ class ClassificationService(LoggerMixin):
             )
 
         try:
-            # Create hash for caching
-            text_hash = str(hash(text.lower().strip()[:100]))
+            # Messages differing only in case or surrounding whitespace share a cache entry
+            cache_key = text.strip().lower()
 
-            # Run classification in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result_json = await loop.run_in_executor(None, self._cached_classify, text_hash, text)
+            for pattern, intent in _FAST_INTENT_RULES:
+                if pattern.fullmatch(cache_key):
+                    return ClassificationResult(
+                        intent=intent, region=None, needs_region=False, confidence=0.99
+                    )
+
+            result_json = await self._classify_single_flight(cache_key, text)
 
             # Parse result
-            result_data = json.loads(result_json)
+            result_data = json_loads(result_json)
 
             # Create ClassificationResult with validation
             classification = ClassificationResult(
@@ -216,6 +376,25 @@ class ClassificationService(LoggerMixin):
                 intent="unknown", region=None, needs_region=False, confidence=0.0
             )
 
+    async def classify_batch(self, texts: List[str]) -> List[ClassificationResult]:
+        """
+        Classify multiple texts concurrently.
+
+        Requests for all distinct texts are issued at once and overlap up to
+        max_concurrency; duplicate texts in the batch are classified once.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            List[ClassificationResult]: Classification results, in input order
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        results = await asyncio.gather(*(self.classify_async(text) for text in unique_texts))
+
+        by_text = dict(zip(unique_texts, results))
+        return [by_text[text] for text in texts]
+
     def classify_sync(self, text: str) -> ClassificationResult:
         """
         Classify text synchronously (for backward compatibility).
@@ -224,18 +403,44 @@ class ClassificationService(LoggerMixin):
             text: Text to classify
 
         Returns:
-            ClassificationResult: Classification result
+            ClassificationResult: Classification result, or an unknown intent if
+            classification doesn't finish within the service timeout
         """
-        # Use asyncio to run the async version
+        # Run the async version on the service's background loop
+        future = asyncio.run_coroutine_threadsafe(
+            self.classify_async(text), self._get_background_loop()
+        )
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.logger.error(f"Sync classification timed out after {self.timeout}s")
+            return ClassificationResult(
+                intent="unknown", region=None, needs_region=False, confidence=0.0
+            )
+
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop used by sync callers, starting it on first use.
 
-        return loop.run_until_complete(self.classify_async(text))
+        The loop runs forever in a daemon thread, so sync callers don't pay
+        for creating and tearing down an event loop on every call.
 
-    def classify_stream(self, text: str) -> Generator[str, None, None]:
+        Returns:
+            asyncio.AbstractEventLoop: Running background event loop
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="classifier-loop",
+                    daemon=True,
+                ).start()
+
+        return self._loop
+
+    def classify_stream(self, text: str) -> Generator[Dict[str, Any], None, None]:
         """
         Stream classification response (useful for debugging).
 
@@ -243,7 +448,7 @@ class ClassificationService(LoggerMixin):
             text: Text to classify
 
         Yields:
-            str: Raw response chunks from LLM
+            Dict[str, Any]: Parsed NDJSON response chunks from LLM
         """
         payload = {
             "model": self.model,
@@ -252,37 +457,69 @@ class ClassificationService(LoggerMixin):
                 {"role": "user", "content": text},
             ],
             "stream": True,
-            "options": {"temperature": 0.0},
+            "format": "json",
+            "options": {"temperature": 0.0, "num_predict": CLASSIFICATION_MAX_TOKENS},
+            "keep_alive": self.keep_alive,
         }
 
         try:
             with self._post_chat(payload, stream=True) as response:
                 response.raise_for_status()
-                for line in response.iter_lines(decode_unicode=True):
+                # Parse raw bytes directly rather than decoding each line first
+                for line in response.iter_lines():
                     if line:
-                        yield line
+                        yield json_loads(line)
         except Exception as e:
             self.logger.error(f"Stream classification failed: {e}")
-            yield f'{{"error": "Classification failed: {str(e)}"}}'
+            yield {"error": f"Classification failed: {e}"}
+
+    def warm_up(self) -> bool:
+        """
+        Load the model and prefill the system prompt ahead of the first request.
+
+        Ollama reuses the KV cache of a matching prompt prefix, so once the
+        system prompt has been processed, classifications only prefill the
+        user message for as long as the model stays loaded (see keep_alive).
+
+        Returns:
+            bool: True if the warm-up request succeeded, False otherwise
+        """
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "system", "content": self.system_prompt}],
+            "stream": False,
+            "options": {"temperature": 0.0, "num_predict": 1},
+            "keep_alive": self.keep_alive,
+        }
+
+        try:
+            with log_performance("llm_warm_up", self.logger):
+                response = self._post_chat(payload, stream=False)
+                response.raise_for_status()
+            return True
+        except Exception as e:
+            self.logger.warning(f"LLM warm-up failed: {e}")
+            return False
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        cache_info = self._cached_classify.cache_info()
+        # The failure cache is only consulted after a success-cache miss,
+        # so its misses are the requests that actually reached the LLM
+        hits = self._success_cache.hits + self._failure_cache.hits
+        misses = self._failure_cache.misses
         return {
-            "hits": cache_info.hits,
-            "misses": cache_info.misses,
-            "maxsize": cache_info.maxsize,
-            "currsize": cache_info.currsize,
-            "hit_rate": (
-                cache_info.hits / (cache_info.hits + cache_info.misses)
-                if (cache_info.hits + cache_info.misses) > 0
-                else 0.0
-            ),
+            "hits": hits,
+            "misses": misses,
+            "maxsize": self._success_cache.maxsize,
+            "currsize": len(self._success_cache),
+            "failure_currsize": len(self._failure_cache),
+            "hit_rate": hits / (hits + misses) if (hits + misses) > 0 else 0.0,
         }
 
     def clear_cache(self) -> None:
-        """Clear the classification cache."""
-        self._cached_classify.cache_clear()
+        """Clear the classification caches."""
+        self._success_cache.clear()
+        self._failure_cache.clear()
         self.logger.info("Classification cache cleared")
 
     def health_check(self) -> Dict[str, Any]:
@@ -320,11 +557,15 @@ class ClassificationService(LoggerMixin):
             new_prompt: New system prompt to use
         """
         self.system_prompt = new_prompt
+        self._build_payload_template()
         self.clear_cache()
         self.logger.info("System prompt updated and cache cleared")
 
 
 # Backward compatibility: provide the same interface as your original llm.py
+_default_service: Optional[ClassificationService] = None
+
+
 def classify(text: str) -> Dict[str, Any]:
     """
     Backward compatibility function for your existing code.
@@ -335,9 +576,12 @@ def classify(text: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Classification result in original format
     """
-    # Create a default service instance
-    service = ClassificationService()
-    result = service.classify_sync(text)
+    global _default_service
+
+    # Reuse a default service instance so its cache and event loop persist
+    if _default_service is None:
+        _default_service = ClassificationService()
+    result = _default_service.classify_sync(text)
 
     # Convert to original format
     return {
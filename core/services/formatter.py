@@ -10,7 +10,8 @@ Classes:
 
 import logging
 import random
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from telegram.constants import ParseMode
 
@@ -41,6 +42,10 @@ class ResponseFormatterService(LoggerMixin):
     help messages, error messages, and internationalization.
     """
 
+    # Markup indicators used to pick the parse mode of outgoing messages
+    _MD_RE = re.compile(r"\*|_|`|\[")
+    _HTML_RE = re.compile(r"<(?:b|i|u|code)>")
+
     def __init__(
         self,
         max_links: int = 6,
@@ -59,13 +64,71 @@ class ResponseFormatterService(LoggerMixin):
         self.regions_per_message = regions_per_message
         self.default_language = default_language
 
+        # Rendered static responses, keyed by language code
+        self._help_cache: Dict[str, str] = {}
+        self._about_cache: Dict[str, str] = {}
+        self._offtopic_cache: Dict[str, str] = {}
+        self._greetings_cache: Dict[str, Tuple[str, ...]] = {}
+        self._smalltalk_cache: Dict[str, Tuple[str, ...]] = {}
+
+        # Bound format methods of translated templates, keyed by language code
+        self._stats_format_cache: Dict[str, Callable[..., str]] = {}
+        self._region_examples_format_cache: Dict[str, Callable[..., str]] = {}
+        self._suggestions_format_cache: Dict[str, Callable[..., str]] = {}
+
+        self._prewarm([self.default_language, "en"])
+
         self.logger.info("Response formatter service initialized")
 
+    def _prewarm(self, languages: List[str]) -> None:
+        """
+        Render static responses and translate templates ahead of the first request.
+
+        Args:
+            languages: Language codes to prepare
+        """
+        for lang in dict.fromkeys(languages):
+            self.format_help_response(lang)
+            self.format_about_response(lang)
+            self.format_off_topic_response(lang)
+            self.format_greeting_response(lang)
+            self.format_smalltalk_response(lang)
+
+            self._get_template_format(self._stats_format_cache, lang, STATS_TEXT_TEMPLATE)
+            self._get_template_format(
+                self._region_examples_format_cache, lang, SUCCESS_MESSAGES["region_examples"]
+            )
+            self._get_template_format(
+                self._suggestions_format_cache, lang, SUCCESS_MESSAGES["suggestions"]
+            )
+
+    def _get_template_format(
+        self, cache: Dict[str, Callable[..., str]], lang: str, template: str
+    ) -> Callable[..., str]:
+        """
+        Get the format method of a translated template, cached per language.
+
+        Args:
+            cache: Per-language cache to read from and fill
+            lang: Language code
+            template: Untranslated template string
+
+        Returns:
+            Callable[..., str]: Bound format method of the translated template
+        """
+        format_template = cache.get(lang)
+        if format_template is None:
+            format_template = get_translator(lang)(template).format
+            cache[lang] = format_template
+        return format_template
+
     def format_links_response(
         self,
         entries: List[CatalogEntry],
         intent: str,
         user_language: Optional[str] = None,
+        *,
+        max_links: Optional[int] = None,
     ) -> str:
         """
         Format a list of catalog entries into a user-friendly message.
@@ -74,6 +137,7 @@ class ResponseFormatterService(LoggerMixin):
             entries: List of catalog entries to format
             intent: Intent name for the header
             user_language: User's language code for i18n
+            max_links: Maximum links to include, defaults to the service's max_links
 
         Returns:
             str: Formatted response message
@@ -84,30 +148,33 @@ class ResponseFormatterService(LoggerMixin):
             return _(ERROR_MESSAGES["no_links"])
 
         # Limit entries
-        limited_entries = entries[: self.max_links]
+        limited_entries = entries[: self.max_links if max_links is None else max_links]
 
         # Create header
         intent_display = intent.replace("_", " ").title()
         header = _(SUCCESS_MESSAGES["links_header"]).format(intent=intent_display)
 
-        # Format links
+        # Format links, stopping before the message would exceed the safe length
         link_items = []
+        total_len = len(header) + 1
         for entry in limited_entries:
-            if entry.url:  # Only add if URL exists
-                link_items.append(f"• {entry.label}: {entry.url}")
+            item = entry.formatted_line
+            if not item:  # Only add if URL exists
+                continue
+
+            if total_len + len(item) + 1 > SAFE_MESSAGE_LENGTH:
+                link_items.append("...")
+                self.logger.warning("Response message truncated due to length")
+                break
+
+            link_items.append(item)
+            total_len += len(item) + 1
 
         if not link_items:
             return _(ERROR_MESSAGES["no_links"])
 
         # Combine header and links
-        message = f"{header}\n\n" + "\n".join(link_items)
-
-        # Check message length and truncate if needed
-        if len(message) > SAFE_MESSAGE_LENGTH:
-            message = message[:SAFE_MESSAGE_LENGTH] + "\n..."
-            self.logger.warning("Response message truncated due to length")
-
-        return message
+        return f"{header}\n\n" + "\n".join(link_items)
 
     def format_greeting_response(self, user_language: Optional[str] = None) -> str:
         """
@@ -119,20 +186,26 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted greeting message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
+        greeting_messages = self._greetings_cache.get(lang)
 
-        # Get translated greeting messages or fall back to defaults
-        try:
-            greeting_messages = [
+        if greeting_messages is None:
+            _ = get_translator(lang)
+
+            greeting_messages = (
                 _("Hi there! 👋 Ready to serve your links al dente 🍝"),
                 _("Hey! I'm here to untangle your public service spaghetti 😉"),
                 _("Hello! Tell me what you need and I'll link it in one click."),
                 _("Ciao! What public service can I help you with today? 🇮🇹"),
-            ]
-        except:
-            greeting_messages = DEFAULT_GREETING_MESSAGES
+            )
+
+            # Fall back to the defaults if no message could be translated
+            greeting_messages = tuple(filter(None, greeting_messages)) or tuple(
+                DEFAULT_GREETING_MESSAGES
+            )
+            self._greetings_cache[lang] = greeting_messages
 
-        return random.choice(greeting_messages)
+        return greeting_messages[random.randrange(len(greeting_messages))]
 
     def format_smalltalk_response(self, user_language: Optional[str] = None) -> str:
         """
@@ -144,19 +217,26 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted smalltalk message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
+        smalltalk_messages = self._smalltalk_cache.get(lang)
 
-        try:
-            smalltalk_messages = [
+        if smalltalk_messages is None:
+            _ = get_translator(lang)
+
+            smalltalk_messages = (
                 _("All good here! Stirring some links in the pot 😄"),
                 _("Thanks! Ask me about car tax, health records, driving license, CUP…"),
                 _("Always online: pixels, pasta, and public administration!"),
                 _("Everything's running smoothly! How can I help with Italian services?"),
-            ]
-        except:
-            smalltalk_messages = DEFAULT_SMALLTALK_MESSAGES
+            )
+
+            # Fall back to the defaults if no message could be translated
+            smalltalk_messages = tuple(filter(None, smalltalk_messages)) or tuple(
+                DEFAULT_SMALLTALK_MESSAGES
+            )
+            self._smalltalk_cache[lang] = smalltalk_messages
 
-        return random.choice(smalltalk_messages)
+        return smalltalk_messages[random.randrange(len(smalltalk_messages))]
 
     def format_help_response(self, user_language: Optional[str] = None) -> str:
         """
@@ -168,12 +248,19 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted help message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
+        if lang in self._help_cache:
+            return self._help_cache[lang]
+
+        _ = get_translator(lang)
 
         try:
-            return _(HELP_TEXT_TEMPLATE)
+            message = _(HELP_TEXT_TEMPLATE)
         except:
-            return HELP_TEXT_TEMPLATE
+            message = HELP_TEXT_TEMPLATE
+
+        self._help_cache[lang] = message
+        return message
 
     def format_about_response(self, user_language: Optional[str] = None) -> str:
         """
@@ -185,12 +272,19 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted about message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
+        if lang in self._about_cache:
+            return self._about_cache[lang]
+
+        _ = get_translator(lang)
 
         try:
-            return _(ABOUT_TEXT_TEMPLATE)
+            message = _(ABOUT_TEXT_TEMPLATE)
         except:
-            return ABOUT_TEXT_TEMPLATE
+            message = ABOUT_TEXT_TEMPLATE
+
+        self._about_cache[lang] = message
+        return message
 
     def format_off_topic_response(self, user_language: Optional[str] = None) -> str:
         """
@@ -202,7 +296,11 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted off-topic message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
+        if lang in self._offtopic_cache:
+            return self._offtopic_cache[lang]
+
+        _ = get_translator(lang)
 
         message = _(
             "I deal with **Italian public services**: health record/recipes, car tax, driving license, "
@@ -210,6 +308,7 @@ class ResponseFormatterService(LoggerMixin):
             'Try: *"Where do I pay the car tax in Lombardia"* or *"Where do I see the doctor\'s prescriptions?"*'
         )
 
+        self._offtopic_cache[lang] = message
         return message
 
     def format_region_request(
@@ -225,15 +324,17 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted region request message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
 
-        if example_regions:
-            examples_text = ", ".join(example_regions[:3])  # Show max 3 examples
-            message = _(SUCCESS_MESSAGES["region_examples"]).format(examples=examples_text)
-        else:
-            message = _("For which region?")
+        if not example_regions:
+            return get_translator(lang)("For which region?")
 
-        return message
+        format_examples = self._get_template_format(
+            self._region_examples_format_cache, lang, SUCCESS_MESSAGES["region_examples"]
+        )
+
+        examples_text = ", ".join(example_regions[:3])  # Show max 3 examples
+        return format_examples(examples=examples_text)
 
     def format_region_suggestions(
         self,
@@ -252,27 +353,28 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted suggestions message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
 
-        if suggestions:
-            suggestions_text = ", ".join(suggestions)
-            message = _(SUCCESS_MESSAGES["suggestions"]).format(
-                region=invalid_region, suggestions=suggestions_text
-            )
-        else:
+        if not suggestions:
             # No suggestions available
-            message = _("I didn't recognize '{region}'. Please try again.").format(
-                region=invalid_region
-            )
+            return get_translator(lang)(
+                "I didn't recognize '{region}'. Please try again."
+            ).format(region=invalid_region)
 
-        return message
+        format_suggestions = self._get_template_format(
+            self._suggestions_format_cache, lang, SUCCESS_MESSAGES["suggestions"]
+        )
+
+        return format_suggestions(region=invalid_region, suggestions=", ".join(suggestions))
 
-    def format_regions_list(self, regions: List[str], user_language: Optional[str] = None) -> str:
+    def format_regions_list(
+        self, regions: Sequence[str], user_language: Optional[str] = None
+    ) -> str:
         """
         Format list of available regions.
 
         Args:
-            regions: List of regions to display
+            regions: Regions to display, already sorted in display order
             user_language: User's language code for i18n
 
         Returns:
@@ -287,11 +389,11 @@ class ResponseFormatterService(LoggerMixin):
 
         if total_regions <= self.regions_per_message:
             # Show all regions in one message
-            regions_text = ", ".join(sorted(regions))
+            regions_text = ", ".join(regions)
             message = _("**Available regions:**\n{regions}").format(regions=regions_text)
         else:
             # Show first batch with count
-            first_batch = sorted(regions)[: self.regions_per_message]
+            first_batch = regions[: self.regions_per_message]
             regions_text = ", ".join(first_batch)
 
             message = _(REGIONS_TEXT_TEMPLATE).format(total=total_regions, regions=regions_text)
@@ -311,15 +413,19 @@ class ResponseFormatterService(LoggerMixin):
         Returns:
             str: Formatted statistics message
         """
-        _ = get_translator(user_language or self.default_language)
+        lang = user_language or self.default_language
 
         try:
+            format_stats = self._get_template_format(
+                self._stats_format_cache, lang, STATS_TEXT_TEMPLATE
+            )
+
             # Extract data with safe defaults
             index_stats = stats_data.get("index", {})
             cache_stats = stats_data.get("cache", {})
             validator_stats = stats_data.get("validator", {})
 
-            message = _(STATS_TEXT_TEMPLATE).format(
+            message = format_stats(
                 total_entries=index_stats.get("total_entries", 0),
                 intents=index_stats.get("intents", 0),
                 regions=index_stats.get("regions", 0),
@@ -339,7 +445,7 @@ class ResponseFormatterService(LoggerMixin):
 
         except Exception as e:
             self.logger.error(f"Error formatting stats response: {e}")
-            return _("Error retrieving statistics.")
+            return get_translator(lang)("Error retrieving statistics.")
 
     def format_error_response(
         self, error_key: str, user_language: Optional[str] = None, **format_args
@@ -356,12 +462,11 @@ class ResponseFormatterService(LoggerMixin):
             str: Formatted error message
         """
         _ = get_translator(user_language or self.default_language)
+        error_template = ERROR_MESSAGES.get(error_key) or ERROR_MESSAGES["generic"]
 
         try:
-            error_template = ERROR_MESSAGES.get(error_key, ERROR_MESSAGES["generic"])
-            message = _(error_template).format(**format_args)
-            return message
-        except Exception as e:
+            return _(error_template).format(**format_args)
+        except (KeyError, IndexError, ValueError) as e:
             self.logger.error(f"Error formatting error response: {e}")
             return _(ERROR_MESSAGES["generic"])
 
@@ -421,11 +526,11 @@ class ResponseFormatterService(LoggerMixin):
             Optional[str]: Parse mode (Markdown, HTML, or None)
         """
         # Check for Markdown indicators
-        if any(indicator in content for indicator in ["**", "*", "_", "`", "["]):
+        if self._MD_RE.search(content):
             return ParseMode.MARKDOWN
 
         # Check for HTML indicators
-        if any(indicator in content for indicator in ["<b>", "<i>", "<u>", "<code>"]):
+        if self._HTML_RE.search(content):
             return ParseMode.HTML
 
         return None
@@ -12,8 +12,10 @@ Classes:
 import difflib
 import logging
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from config.constants import (
     MAX_SPAM_REPETITION_RATIO,
@@ -24,8 +26,77 @@ from utils.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
 
+# Combining diacritical marks left behind by NFD decomposition (e.g. "à" -> "a" + U+0300)
+_COMBINING_MARKS_TABLE = dict.fromkeys(range(0x0300, 0x0370))
 
-@dataclass
+# Typographic apostrophes become plain ones, separators become spaces
+_PUNCTUATION_TABLE = str.maketrans({"\u2018": "'", "\u2019": "'", "-": " ", "_": " "})
+
+# ASCII characters that are neither alphanumeric nor whitespace, for spam detection
+_ASCII_PUNCTUATION_BYTES = bytes(
+    i for i in range(128) if not (chr(i).isalnum() or chr(i).isspace())
+)
+
+
+@lru_cache(maxsize=1024)
+def _normalize(text: str) -> str:
+    """Casefold, strip accents and normalize punctuation and whitespace."""
+    text = text.casefold()
+
+    # ASCII text has no accents to decompose and strip
+    if not text.isascii():
+        text = unicodedata.normalize("NFD", text).translate(_COMBINING_MARKS_TABLE)
+
+    return " ".join(text.translate(_PUNCTUATION_TABLE).split())
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Get the set of character trigrams of text, padded to weight word edges."""
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+# Common Italian region aliases (English names, main cities, alternative spellings)
+_RAW_REGION_MAPPINGS: Dict[str, str] = {
+    # English names
+    "lombardy": "Lombardia",
+    "piedmont": "Piemonte",
+    "tuscany": "Toscana",
+    "sicily": "Sicilia",
+    "sardinia": "Sardegna",
+    "apulia": "Puglia",
+    # City to region mappings
+    "roma": "Lazio",
+    "rome": "Lazio",
+    "milano": "Lombardia",
+    "milan": "Lombardia",
+    "napoli": "Campania",
+    "naples": "Campania",
+    "torino": "Piemonte",
+    "turin": "Piemonte",
+    "firenze": "Toscana",
+    "florence": "Toscana",
+    "bologna": "Emilia-Romagna",
+    "venezia": "Veneto",
+    "venice": "Veneto",
+    "genova": "Liguria",
+    "genoa": "Liguria",
+    "bari": "Puglia",
+    "palermo": "Sicilia",
+    "catania": "Sicilia",
+    # Alternative spellings
+    "emilia romagna": "Emilia-Romagna",
+    "friuli venezia giulia": "Friuli-Venezia Giulia",
+    "trentino alto adige": "Trentino-Alto Adige",
+    "valle daosta": "Valle d'Aosta",
+}
+
+_NORMALIZED_ALIAS_PAIRS: List[Tuple[str, str]] = [
+    (_normalize(alias), region) for alias, region in _RAW_REGION_MAPPINGS.items()
+]
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """
     Result of input validation.
@@ -79,7 +150,7 @@ class InputValidationService(LoggerMixin):
 
     def __init__(
         self,
-        regions: List[str],
+        regions: Iterable[str],
         max_message_length: int = 1000,
         fuzzy_match_threshold: float = 0.7,
         suggestion_threshold: float = 0.4,
@@ -88,27 +159,39 @@ class InputValidationService(LoggerMixin):
         Initialize validation service.
 
         Args:
-            regions: List of valid region names
+            regions: Valid region names; a frozenset is used as-is without copying
             max_message_length: Maximum allowed message length
             fuzzy_match_threshold: Minimum similarity for fuzzy matching
             suggestion_threshold: Minimum similarity for suggestions
         """
-        self.regions = set(regions)
+        self.regions = self._freeze_regions(regions)
+        self._sorted_regions: Tuple[str, ...] = tuple(sorted(self.regions))
         self.max_message_length = max_message_length
         self.fuzzy_match_threshold = fuzzy_match_threshold
         self.suggestion_threshold = suggestion_threshold
 
         # Build normalized region mappings
-        self.normalized_regions = {self._normalize_text(r): r for r in regions}
+        self.normalized_regions = {self._normalize_text(r): r for r in self.regions}
 
         # Build region aliases
         self.region_aliases = self._build_region_aliases()
 
+        # Combined lookup for the hot path; canonical names take precedence over aliases
+        self._lookup: Dict[str, str] = {**self.region_aliases, **self.normalized_regions}
+
+        # Build trigram index for fuzzy suggestions
+        self._build_trigram_index()
+
         self.logger.info(
             f"Input validator initialized with {len(self.regions)} regions, "
             f"{len(self.region_aliases)} aliases"
         )
 
+    @staticmethod
+    def _freeze_regions(regions: Iterable[str]) -> FrozenSet[str]:
+        """Return regions as a frozenset, reusing the argument when it already is one."""
+        return regions if isinstance(regions, frozenset) else frozenset(regions)
+
     def _normalize_text(self, text: str) -> str:
         """
         Normalize text for comparison.
@@ -122,21 +205,28 @@ class InputValidationService(LoggerMixin):
         if not text:
             return ""
 
-        # Convert to lowercase
-        text = text.lower().strip()
+        return _normalize(text)
 
-        # Remove accents and diacritics
-        text = unicodedata.normalize("NFD", text)
-        text = "".join(c for c in text if unicodedata.category(c) != "Mn")
+    def _normalize_for_lookup(self, text: str) -> str:
+        """
+        Sanitize and normalize user input for region lookups in a single step.
 
-        # Normalize punctuation
-        text = text.replace("'", "'").replace("'", "'")  # Normalize apostrophes
-        text = text.replace("-", " ").replace("_", " ")  # Normalize separators
+        Equivalent to sanitize_input followed by _normalize_text, but control
+        characters are only filtered out when present.
 
-        # Remove extra whitespace
-        text = " ".join(text.split())
+        Args:
+            text: Raw user input
 
-        return text
+        Returns:
+            str: Normalized text
+        """
+        if not text:
+            return ""
+
+        if not text.isprintable():
+            text = "".join(c for c in text if c.isprintable() or c in "\n\t")
+
+        return _normalize(text)
 
     def _build_region_aliases(self) -> Dict[str, str]:
         """
@@ -145,56 +235,28 @@ class InputValidationService(LoggerMixin):
         Returns:
             Dict[str, str]: Mapping from alias to canonical region name
         """
-        aliases = {}
-
-        # Common Italian region aliases
-        region_mappings = {
-            # English names
-            "lombardy": "Lombardia",
-            "piedmont": "Piemonte",
-            "tuscany": "Toscana",
-            "sicily": "Sicilia",
-            "sardinia": "Sardegna",
-            "apulia": "Puglia",
-            # City to region mappings
-            "roma": "Lazio",
-            "rome": "Lazio",
-            "milano": "Lombardia",
-            "milan": "Lombardia",
-            "napoli": "Campania",
-            "naples": "Campania",
-            "torino": "Piemonte",
-            "turin": "Piemonte",
-            "firenze": "Toscana",
-            "florence": "Toscana",
-            "bologna": "Emilia-Romagna",
-            "venezia": "Veneto",
-            "venice": "Veneto",
-            "genova": "Liguria",
-            "genoa": "Liguria",
-            "bari": "Puglia",
-            "palermo": "Sicilia",
-            "catania": "Sicilia",
-            # Alternative spellings
-            "emilia romagna": "Emilia-Romagna",
-            "friuli venezia giulia": "Friuli-Venezia Giulia",
-            "trentino alto adige": "Trentino-Alto Adige",
-            "valle daosta": "Valle d'Aosta",
+        # Common Italian region aliases, limited to the configured regions
+        aliases = {
+            alias: region for alias, region in _NORMALIZED_ALIAS_PAIRS if region in self.regions
         }
 
-        # Add normalized versions of mappings
-        for alias, region in region_mappings.items():
-            normalized_alias = self._normalize_text(alias)
-            if region in self.regions:
-                aliases[normalized_alias] = region
-
         # Add normalized versions of actual region names
-        for region in self.regions:
-            normalized = self._normalize_text(region)
-            aliases[normalized] = region
+        aliases.update((self._normalize_text(region), region) for region in self.regions)
 
         return aliases
 
+    def _build_trigram_index(self) -> None:
+        """Build the trigram inverted index over normalized region names and aliases."""
+        self._trigram_keys: List[Tuple[str, int]] = []
+        self._trigram_index: Dict[str, List[int]] = {}
+
+        for key in self.region_aliases:
+            key_id = len(self._trigram_keys)
+            key_trigrams = _trigrams(key)
+            self._trigram_keys.append((key, len(key_trigrams)))
+            for trigram in key_trigrams:
+                self._trigram_index.setdefault(trigram, []).append(key_id)
+
     def validate_message_length(self, text: str) -> ValidationResult:
         """
         Validate message length.
@@ -247,7 +309,12 @@ class InputValidationService(LoggerMixin):
                 )
 
         # Check for excessive punctuation
-        punctuation_count = sum(1 for c in text if not c.isalnum() and not c.isspace())
+        if text.isascii():
+            encoded = text.encode("ascii")
+            without_punctuation = encoded.translate(None, _ASCII_PUNCTUATION_BYTES)
+            punctuation_count = len(encoded) - len(without_punctuation)
+        else:
+            punctuation_count = sum(1 for c in text if not c.isalnum() and not c.isspace())
         if len(text) > 10 and punctuation_count / len(text) > 0.5:
             return ValidationResult.invalid(
                 "Message contains excessive punctuation", original_value=text
@@ -290,33 +357,21 @@ class InputValidationService(LoggerMixin):
             return ValidationResult.invalid("Region cannot be empty", original_value=region_text)
 
         original_text = region_text.strip()
-        sanitized_text = self.sanitize_input(original_text)
-        normalized_input = self._normalize_text(sanitized_text)
+        normalized_input = self._normalize_for_lookup(original_text)
 
-        # Direct match with normalization
-        if normalized_input in self.normalized_regions:
-            canonical_region = self.normalized_regions[normalized_input]
+        # Direct match against normalized region names and aliases
+        canonical_region = self._lookup.get(normalized_input)
+        if canonical_region:
             return ValidationResult.valid(canonical_region, original_text)
 
-        # Check aliases
-        if normalized_input in self.region_aliases:
-            canonical_region = self.region_aliases[normalized_input]
-            return ValidationResult.valid(canonical_region, original_text)
-
-        # Exact match against original regions (case-insensitive)
-        for region in self.regions:
-            if region.lower() == original_text.lower():
-                return ValidationResult.valid(region, original_text)
-
         # Fuzzy matching for close matches
         suggestions = self._get_region_suggestions(normalized_input)
 
         if suggestions:
-            # If we have a very close match (above fuzzy threshold), use it
-            normalized_regions_list = list(self.normalized_regions.keys())
+            # If a suggestion is a very close match (above fuzzy threshold), use it
             close_matches = difflib.get_close_matches(
                 normalized_input,
-                normalized_regions_list,
+                [self._normalize_text(suggestion) for suggestion in suggestions],
                 n=1,
                 cutoff=self.fuzzy_match_threshold,
             )
@@ -347,7 +402,45 @@ class InputValidationService(LoggerMixin):
         if not normalized_input:
             return []
 
-        suggestions = []
+        # Count shared trigrams per candidate straight from the inverted index
+        input_trigrams = _trigrams(normalized_input)
+        shared_counts: Counter = Counter()
+        for trigram in input_trigrams:
+            shared_counts.update(self._trigram_index.get(trigram, ()))
+
+        # Score candidates by trigram similarity (Dice coefficient)
+        input_size = len(input_trigrams)
+        scored = []
+        for key_id, shared in shared_counts.items():
+            key, key_size = self._trigram_keys[key_id]
+            score = 2 * shared / (input_size + key_size)
+            if score >= self.suggestion_threshold:
+                scored.append((score, key))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        # Deduplicate canonical names, preserving score order
+        seen: Dict[str, None] = {}
+        for _, key in scored:
+            seen.setdefault(self.region_aliases[key], None)
+
+        if not seen:
+            return self._get_difflib_suggestions(normalized_input, max_suggestions)
+
+        return list(seen)[:max_suggestions]
+
+    def _get_difflib_suggestions(self, normalized_input: str, max_suggestions: int) -> List[str]:
+        """
+        Get region suggestions using difflib, as a fallback for the trigram index.
+
+        Args:
+            normalized_input: Normalized input text
+            max_suggestions: Maximum number of suggestions
+
+        Returns:
+            List[str]: List of suggested regions
+        """
+        seen: Dict[str, None] = {}
 
         # Get fuzzy matches from normalized regions
         normalized_regions_list = list(self.normalized_regions.keys())
@@ -360,9 +453,7 @@ class InputValidationService(LoggerMixin):
 
         # Convert back to canonical names
         for match in region_matches:
-            canonical = self.normalized_regions[match]
-            if canonical not in suggestions:
-                suggestions.append(canonical)
+            seen.setdefault(self.normalized_regions[match], None)
 
         # Get fuzzy matches from aliases
         alias_keys = list(self.region_aliases.keys())
@@ -375,11 +466,9 @@ class InputValidationService(LoggerMixin):
 
         # Convert aliases to canonical names
         for alias in alias_matches:
-            canonical = self.region_aliases[alias]
-            if canonical not in suggestions:
-                suggestions.append(canonical)
+            seen.setdefault(self.region_aliases[alias], None)
 
-        return suggestions[:max_suggestions]
+        return list(seen)[:max_suggestions]
 
     def validate_message(self, message_text: str) -> ValidationResult:
         """
@@ -423,7 +512,7 @@ class InputValidationService(LoggerMixin):
             "max_message_length": self.max_message_length,
             "fuzzy_match_threshold": self.fuzzy_match_threshold,
             "suggestion_threshold": self.suggestion_threshold,
-            "regions_list": sorted(list(self.regions)),
+            "regions_list": list(self._sorted_regions),
         }
 
     def get_popular_regions(self, count: int = 5) -> List[str]:
@@ -438,18 +527,26 @@ class InputValidationService(LoggerMixin):
         """
         # For now, just return first N regions alphabetically
         # In a real implementation, this could be based on usage statistics
-        return sorted(list(self.regions))[:count]
+        return list(self._sorted_regions[:count])
+
+    @property
+    def sorted_regions(self) -> Tuple[str, ...]:
+        """Get valid region names in alphabetical order."""
+        return self._sorted_regions
 
-    def update_regions(self, new_regions: List[str]) -> None:
+    def update_regions(self, new_regions: Iterable[str]) -> None:
         """
         Update the list of valid regions.
 
         Args:
-            new_regions: New list of region names
+            new_regions: New region names; a frozenset is used as-is without copying
         """
-        self.regions = set(new_regions)
-        self.normalized_regions = {self._normalize_text(r): r for r in new_regions}
+        self.regions = self._freeze_regions(new_regions)
+        self._sorted_regions = tuple(sorted(self.regions))
+        self.normalized_regions = {self._normalize_text(r): r for r in self.regions}
         self.region_aliases = self._build_region_aliases()
+        self._lookup = {**self.region_aliases, **self.normalized_regions}
+        self._build_trigram_index()
 
         self.logger.info(
             f"Updated regions: {len(self.regions)} regions, {len(self.region_aliases)} aliases"
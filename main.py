@@ -12,19 +12,32 @@ Author: Luigi Aiello
 License: MIT
 """
 
-import asyncio
 import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 from config.settings import Settings, load_settings
 from core.bot import PAstaLinkBot
 from utils.logging import setup_logging
 
 
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when it is available.
+
+    Must run before the bot creates its event loop. uvloop is an optional
+    dependency and is not available on Windows.
+
+    Returns:
+        bool: True if uvloop was installed, False if the stock loop is used
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    return True
+
+
 def main() -> None:
     """
     Main application entry point.
@@ -36,6 +49,9 @@ def main() -> None:
         SystemExit: If required configuration is missing or bot fails to start
     """
     try:
+        # Switch to uvloop before anything creates an event loop
+        uvloop_installed = install_uvloop()
+
         # Load configuration
         settings = load_settings()
 
@@ -44,6 +60,7 @@ def main() -> None:
         logger.info("Starting PAstaLinkBot...")
         logger.info(f"Environment: {settings.environment}")
         logger.info(f"Log level: {settings.log_level}")
+        logger.info(f"Event loop: {'uvloop' if uvloop_installed else 'asyncio'}")
 
         # Validate required configuration
         if not settings.telegram_token:
@@ -8,6 +8,7 @@ This script helps manage dependencies for different environments.
 import argparse
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -30,10 +31,34 @@ def run_command(cmd, description):
         return False
 
 
+def run_command_captured(cmd, description):
+    """
+    Run a command with its output captured, so it can be printed as one block.
+
+    Returns:
+        tuple: (success, report) where report is the banner, output and result
+    """
+    lines = [f"\n{'='*60}", f"Running: {description}", f"Command: {' '.join(cmd)}", "=" * 60]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        lines.append(f"\n❌ Command not found: {cmd[0]}")
+        return False, "\n".join(lines)
+
+    lines.extend(output for output in (result.stdout, result.stderr) if output)
+    if result.returncode == 0:
+        lines.append(f"\n✅ {description} completed successfully!")
+    else:
+        lines.append(f"\n❌ {description} failed with exit code {result.returncode}")
+
+    return result.returncode == 0, "\n".join(lines)
+
+
 def install_dependencies(env_type, upgrade=False, dev=False):
     """Install dependencies for the specified environment."""
     if env_type == "prod":
-        cmd = ["pip", "install", "-r", "requirements/prod.txt"]
+        cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements/prod.txt"]
         if upgrade:
             cmd.append("--upgrade")
         return run_command(cmd, "Production Dependencies")
@@ -41,25 +66,25 @@ def install_dependencies(env_type, upgrade=False, dev=False):
     elif env_type == "dev":
         if dev:
             # Use pyproject.toml for development
-            cmd = ["pip", "install", "-e", ".[dev]"]
+            cmd = [sys.executable, "-m", "pip", "install", "-e", ".[dev]"]
             if upgrade:
                 cmd.append("--upgrade")
             return run_command(cmd, "Development Dependencies (pyproject.toml)")
         else:
             # Use requirements file
-            cmd = ["pip", "install", "-r", "requirements/dev.txt"]
+            cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements/dev.txt"]
             if upgrade:
                 cmd.append("--upgrade")
             return run_command(cmd, "Development Dependencies")
 
     elif env_type == "test":
-        cmd = ["pip", "install", "-r", "requirements/test.txt"]
+        cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements/test.txt"]
         if upgrade:
             cmd.append("--upgrade")
         return run_command(cmd, "Test Dependencies")
 
     elif env_type == "base":
-        cmd = ["pip", "install", "-r", "requirements/base.txt"]
+        cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements/base.txt"]
         if upgrade:
             cmd.append("--upgrade")
         return run_command(cmd, "Base Dependencies")
@@ -77,25 +102,37 @@ def setup_pre_commit():
 
 def run_linting():
     """Run code linting and formatting."""
-    commands = [
+    # Formatters rewrite files in place, so they run one after the other
+    formatters = [
         (["black", "."], "Code Formatting (Black)"),
         (["isort", "."], "Import Sorting (isort)"),
+    ]
+    # Checkers only read files, so they run concurrently once formatting is done
+    checkers = [
         (["flake8", "."], "Code Linting (flake8)"),
         # (["mypy", "."], "Type Checking (mypy)"),
     ]
 
     success = True
-    for cmd, description in commands:
+    for cmd, description in formatters:
         if not run_command(cmd, description):
             success = False
 
+    with ThreadPoolExecutor(max_workers=len(checkers)) as executor:
+        results = list(executor.map(lambda check: run_command_captured(*check), checkers))
+
+    for check_success, report in results:
+        print(report)
+        if not check_success:
+            success = False
+
     return success
 
 
 def run_tests():
     """Run tests with coverage."""
     cmd = [
-        "python",
+        sys.executable,
         "-m",
         "pytest",
         "--cov=core",
@@ -7,6 +7,7 @@ with various configurations.
 """
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -34,23 +35,47 @@ def run_command(cmd, description):
         return False
 
 
+def exec_command(cmd, description):
+    """
+    Replace the current process with the command, when the platform allows it.
+
+    Only one command runs per invocation, so there is no need to keep this
+    interpreter alive just to wait for it; the command's exit code becomes ours.
+    """
+    if os.name != "posix":
+        return run_command(cmd, description)
+
+    print(f"\n{'='*60}")
+    print(f"Running: {description}")
+    print(f"Command: {' '.join(cmd)}")
+    print("=" * 60)
+    sys.stdout.flush()
+
+    os.execv(cmd[0], cmd)
+
+
 def main():
     """Main test runner function."""
     parser = argparse.ArgumentParser(description="PAstaLinkBot Test Runner")
     parser.add_argument(
         "--type",
-        choices=["unit", "integration", "all", "coverage", "quick", "basic"],
+        choices=["unit", "integration", "all", "coverage", "quick", "basic", "benchmark"],
         default="basic",
         help="Type of tests to run",
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--slow", action="store_true", help="Include slow tests")
     parser.add_argument("--stop-on-failure", action="store_true", help="Stop on first failure")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Distribute tests across all CPU cores (requires pytest-xdist)",
+    )
 
     args = parser.parse_args()
 
     # Base pytest command
-    base_cmd = ["python", "-m", "pytest"]
+    base_cmd = [sys.executable, "-m", "pytest"]
 
     if args.verbose:
         base_cmd.append("-v")
@@ -58,18 +83,22 @@ def main():
     if args.stop_on_failure:
         base_cmd.append("-x")
 
+    if args.parallel:
+        # Keep each module on one worker so module/session fixtures are built once per worker
+        base_cmd.extend(["-n", "auto", "--dist=loadfile"])
+
     # Test type specific commands
     if args.type == "basic":
         cmd = base_cmd + ["../tests/test_basic.py"]
-        success = run_command(cmd, "Basic Tests")
+        success = exec_command(cmd, "Basic Tests")
 
     elif args.type == "unit":
         cmd = base_cmd + ["-m", "unit", "--ignore=../tests/test_handlers_integration.py"]
-        success = run_command(cmd, "Unit Tests")
+        success = exec_command(cmd, "Unit Tests")
 
     elif args.type == "integration":
         cmd = base_cmd + ["-m", "integration", "../tests/test_handlers_integration.py"]
-        success = run_command(cmd, "Integration Tests")
+        success = exec_command(cmd, "Integration Tests")
 
     elif args.type == "coverage":
         cmd = base_cmd + [
@@ -80,7 +109,7 @@ def main():
             "--cov-report=html:htmlcov",
             "--cov-fail-under=80",
         ]
-        success = run_command(cmd, "Tests with Coverage")
+        success = exec_command(cmd, "Tests with Coverage")
 
     elif args.type == "quick":
         cmd = base_cmd + [
@@ -88,13 +117,17 @@ def main():
             "not slow",
             "--ignore=../tests/test_handlers_integration.py",
         ]
-        success = run_command(cmd, "Quick Tests (excluding slow tests)")
+        success = exec_command(cmd, "Quick Tests (excluding slow tests)")
+
+    elif args.type == "benchmark":
+        cmd = base_cmd + ["-m", "benchmark", "../tests/test_bench.py"]
+        success = exec_command(cmd, "Benchmarks")
 
     else:  # all
         cmd = base_cmd
         if not args.slow:
             cmd.extend(["-m", "not slow"])
-        success = run_command(cmd, "All Tests")
+        success = exec_command(cmd, "All Tests")
 
     # Summary
     print(f"\n{'='*60}")
@@ -4,10 +4,10 @@ Pytest configuration and fixtures for PAstaLinkBot tests.
 This module provides common fixtures and configuration for all tests.
 """
 
-import json
+import copy
 from pathlib import Path
-from typing import Any, Dict, List
-from unittest.mock import Mock, patch
+from typing import Any, Dict, List, Tuple
+from unittest.mock import Mock
 
 import pytest
 
@@ -16,12 +16,16 @@ from core.models.intent import CatalogEntry
 from core.services.catalog import CatalogService
 from core.services.classifier import ClassificationService
 from core.services.formatter import ResponseFormatterService
-from core.services.validator import InputValidationService, ValidationResult
+from core.services.validator import InputValidationService
+from utils.helpers import json_dumps
 
+# Test modules whose tests are marked as integration tests, all others are unit tests
+INTEGRATION_TEST_FILES = frozenset({"test_handlers_integration.py"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_catalog_data() -> List[Dict[str, Any]]:
-    """Sample catalog data for testing."""
+    """Sample catalog data for testing, shared across the session (do not mutate)."""
     return [
         {
             "intent": "fascicolo_sanitario",
@@ -54,18 +58,23 @@ def sample_catalog_data() -> List[Dict[str, Any]]:
     ]
 
 
-@pytest.fixture
-def sample_catalog_entries(sample_catalog_data) -> List[CatalogEntry]:
-    """Sample catalog entries for testing."""
-    return [CatalogEntry(**entry) for entry in sample_catalog_data]
+@pytest.fixture(scope="session")
+def sample_catalog_entries(sample_catalog_data) -> Tuple[CatalogEntry, ...]:
+    """Sample catalog entries for testing, validated once and shared across the session."""
+    return tuple(CatalogEntry(**entry) for entry in sample_catalog_data)
+
+
+@pytest.fixture(scope="session")
+def sample_catalog_bytes(sample_catalog_data) -> bytes:
+    """Sample catalog data serialized once per session as UTF-8 JSON."""
+    return json_dumps(sample_catalog_data).encode("utf-8")
 
 
 @pytest.fixture
-def temp_catalog_file(tmp_path, sample_catalog_data) -> Path:
+def temp_catalog_file(tmp_path, sample_catalog_bytes) -> Path:
     """Create a temporary catalog file for testing."""
     catalog_file = tmp_path / "test_catalog.json"
-    with open(catalog_file, "w", encoding="utf-8") as f:
-        json.dump(sample_catalog_data, f, ensure_ascii=False, indent=2)
+    catalog_file.write_bytes(sample_catalog_bytes)
     return catalog_file
 
 
@@ -88,15 +97,24 @@ def mock_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def _catalog_service_template(sample_catalog_entries) -> CatalogService:
+    """Catalog service indexed once per session, copied by catalog_service."""
+    return CatalogService.from_entries(sample_catalog_entries, max_links_per_response=6)
+
+
 @pytest.fixture
-def catalog_service(temp_catalog_file) -> CatalogService:
+def catalog_service(_catalog_service_template) -> CatalogService:
     """Catalog service instance for testing."""
-    return CatalogService(data_path=str(temp_catalog_file), max_links_per_response=6)
+    service = copy.copy(_catalog_service_template)
+    # Entries and index are read-only, but usage stats are updated in place
+    service.stats = {}
+    return service
 
 
-@pytest.fixture
-def validation_service() -> InputValidationService:
-    """Validation service instance for testing."""
+@pytest.fixture(scope="session")
+def _validation_service_template() -> InputValidationService:
+    """Validation service with its lookup tables built once per session."""
     regions = ["Lombardia", "Lazio", "Toscana", "Veneto", "Piemonte", "Nazionale"]
     return InputValidationService(
         regions=regions,
@@ -106,6 +124,13 @@ def validation_service() -> InputValidationService:
     )
 
 
+@pytest.fixture
+def validation_service(_validation_service_template) -> InputValidationService:
+    """Validation service instance for testing."""
+    # update_regions rebinds its tables rather than mutating them, so a shallow copy suffices
+    return copy.copy(_validation_service_template)
+
+
 @pytest.fixture
 def classifier_service() -> ClassificationService:
     """Classification service instance for testing."""
@@ -117,9 +142,9 @@ def classifier_service() -> ClassificationService:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def formatter_service() -> ResponseFormatterService:
-    """Response formatter service instance for testing."""
+    """Response formatter shared across the session; its caches are filled idempotently."""
     return ResponseFormatterService(max_links=6, regions_per_message=15)
 
 
@@ -147,7 +172,7 @@ def mock_telegram_context():
     return context
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ollama_response():
     """Mock Ollama API response."""
     return {
@@ -158,10 +183,10 @@ def mock_ollama_response():
     }
 
 
-@pytest.fixture
-def sample_regions() -> List[str]:
-    """Sample list of Italian regions for testing."""
-    return [
+@pytest.fixture(scope="session")
+def sample_regions() -> Tuple[str, ...]:
+    """Sample Italian regions for testing, shared across the session."""
+    return (
         "Abruzzo",
         "Basilicata",
         "Calabria",
@@ -183,10 +208,10 @@ def sample_regions() -> List[str]:
         "Valle d'Aosta",
         "Veneto",
         "Nazionale",
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_classification_results() -> List[Dict[str, Any]]:
     """Sample classification results for testing."""
     return [
@@ -220,13 +245,22 @@ def pytest_configure(config):
     )
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
     config.addinivalue_line("markers", "unit: marks tests as unit tests")
+    config.addinivalue_line(
+        "markers", "benchmark: marks performance benchmarks (run with '-m benchmark')"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers."""
+    # Benchmarks only run when explicitly selected, so normal runs stay fast
+    run_benchmarks = "benchmark" in config.getoption("markexpr", "")
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with '-m benchmark'")
+
     for item in items:
-        if "test_" in item.nodeid:
-            if "integration" in item.nodeid:
-                item.add_marker(pytest.mark.integration)
-            else:
-                item.add_marker(pytest.mark.unit)
+        if item.path.name in INTEGRATION_TEST_FILES:
+            item.add_marker(pytest.mark.integration)
+        else:
+            item.add_marker(pytest.mark.unit)
+
+        if not run_benchmarks and item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
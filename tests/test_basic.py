@@ -5,68 +5,72 @@ This module contains basic tests that verify the core components
 work correctly with the actual implementation.
 """
 
-from typing import List
-from unittest.mock import Mock, patch
+import asyncio
+import json
+import logging
+import time
+from dataclasses import FrozenInstanceError
+from logging.handlers import MemoryHandler, QueueHandler
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from telegram.constants import ParseMode
 
+import utils.logging as utils_logging
+from config.constants import SAFE_MESSAGE_LENGTH
 from core.models.intent import CatalogEntry, ClassificationResult
 from core.services.catalog import CatalogService
 from core.services.classifier import ClassificationService
 from core.services.formatter import ResponseFormatterService
-from core.services.validator import InputValidationService
+from core.services.validator import InputValidationService, ValidationResult
+from utils.decorators import (
+    RateLimiter,
+    cache_result,
+    handle_telegram_errors,
+    log_handler_call,
+    rate_limit,
+    retry,
+    telegram_handler,
+)
+from utils.i18n import get_translator
+from utils.logging import JSONFormatter, LoggerMixin, setup_logging, stop_logging
 
 
 class TestCatalogEntry:
     """Test cases for CatalogEntry model."""
 
-    def test_init_valid(self):
-        """Test creating a valid CatalogEntry."""
-        entry = CatalogEntry(
-            intent="fascicolo_sanitario",
-            region="Lombardia",
-            label="FSE Lombardia",
-            url="https://example.com",
-        )
-
-        assert entry.intent == "fascicolo_sanitario"
-        assert entry.region == "Lombardia"
-        assert entry.label == "FSE Lombardia"
-        assert entry.url == "https://example.com"
-
-    def test_init_with_description(self):
-        """Test creating CatalogEntry with description."""
-        entry = CatalogEntry(
-            intent="fascicolo_sanitario",
-            region="Lombardia",
-            label="FSE Lombardia",
-            url="https://example.com",
-            description="Test description",
-        )
-
-        assert entry.description == "Test description"
-
-    def test_init_with_tags(self):
-        """Test creating CatalogEntry with tags."""
-        entry = CatalogEntry(
-            intent="fascicolo_sanitario",
-            region="Lombardia",
-            label="FSE Lombardia",
-            url="https://example.com",
-            tags=["health", "medical"],
-        )
-
-        assert entry.tags == ["health", "medical"]
+    BASE_FIELDS = {
+        "intent": "fascicolo_sanitario",
+        "region": "Lombardia",
+        "label": "FSE Lombardia",
+        "url": "https://example.com",
+    }
+
+    @pytest.mark.parametrize(
+        "extra_fields, expected",
+        [
+            pytest.param({}, BASE_FIELDS, id="required_only"),
+            pytest.param(
+                {"description": "Test description"},
+                {"description": "Test description"},
+                id="with_description",
+            ),
+            pytest.param(
+                {"tags": ["health", "medical"]}, {"tags": ["health", "medical"]}, id="with_tags"
+            ),
+        ],
+    )
+    def test_init_fields(self, extra_fields, expected):
+        """Test creating a valid CatalogEntry with optional fields."""
+        entry = CatalogEntry(**self.BASE_FIELDS, **extra_fields)
+
+        for field, value in expected.items():
+            assert getattr(entry, field) == value
 
     def test_init_invalid_url(self):
         """Test creating CatalogEntry with invalid URL."""
-        with pytest.raises(ValueError):
-            CatalogEntry(
-                intent="fascicolo_sanitario",
-                region="Lombardia",
-                label="FSE Lombardia",
-                url="not-a-url",
-            )
+        with pytest.raises(ValueError, match="Invalid URL format"):
+            CatalogEntry(**{**self.BASE_FIELDS, "url": "not-a-url"})
 
     def test_is_national(self):
         """Test is_national property."""
@@ -77,28 +81,30 @@ class TestCatalogEntry:
             url="https://example.com",
         )
 
-        regional_entry = CatalogEntry(
-            intent="fascicolo_sanitario",
-            region="Lombardia",
-            label="FSE Lombardia",
-            url="https://example.com",
-        )
+        regional_entry = CatalogEntry(**self.BASE_FIELDS)
 
         assert national_entry.is_national is True
         assert regional_entry.is_national is False
 
     def test_matches_request(self):
         """Test matches_request method."""
+        entry = CatalogEntry(**self.BASE_FIELDS)
+
+        assert entry.matches_request("fascicolo_sanitario", "Lombardia") is True
+        assert entry.matches_request("fascicolo_sanitario") is False  # Not national
+        assert entry.matches_request("bollo_auto", "Lombardia") is False
+
+    def test_formatted_line(self):
+        """Test formatted_line property."""
         entry = CatalogEntry(
             intent="fascicolo_sanitario",
             region="Lombardia",
-            label="FSE Lombardia",
+            label=" FSE Lombardia ",
             url="https://example.com",
         )
 
-        assert entry.matches_request("fascicolo_sanitario", "Lombardia") is True
-        assert entry.matches_request("fascicolo_sanitario") is False  # Not national
-        assert entry.matches_request("bollo_auto", "Lombardia") is False
+        assert entry.formatted_line == "• FSE Lombardia: https://example.com"
+        assert entry.formatted_line is entry.formatted_line
 
     def test_to_dict(self):
         """Test to_dict method."""
@@ -147,7 +153,7 @@ class TestClassificationResult:
 
     def test_init_invalid_confidence(self):
         """Test creating ClassificationResult with invalid confidence."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Confidence must be between"):
             ClassificationResult(intent="greeting", confidence=1.5)  # Invalid confidence
 
     def test_to_dict(self):
@@ -177,6 +183,15 @@ class TestCatalogService:
         assert service.data_path == temp_catalog_file
         assert service.max_links_per_response == 5
 
+    def test_from_entries(self, sample_catalog_entries):
+        """Test building a CatalogService from in-memory entries."""
+        service = CatalogService.from_entries(sample_catalog_entries, max_links_per_response=2)
+
+        assert service.entry_count == len(sample_catalog_entries)
+        assert service.max_links_per_response == 2
+        assert service.get_regions() == ["Lazio", "Lombardia"]
+        assert service.get_links("cup", "Lazio")[0].label == "CUP Lazio"
+
     def test_get_regions(self, catalog_service):
         """Test getting regions from catalog."""
         regions = catalog_service.get_regions()
@@ -217,6 +232,15 @@ class TestCatalogService:
 
         assert len(links) == 0
 
+    def test_index_buckets_are_shared_tuples(self, catalog_service):
+        """Test that index lookups return the frozen buckets without copying them."""
+        index = catalog_service.index
+        bucket = index.intent_region_index["cup|Lazio"]
+
+        assert isinstance(bucket, tuple)
+        assert index.get_entries("cup", "Lazio") is bucket
+        assert catalog_service.get_links("cup", "Lazio") == list(bucket)
+
     def test_get_statistics(self, catalog_service):
         """Test getting catalog statistics."""
         stats = catalog_service.get_statistics()
@@ -238,11 +262,25 @@ class TestInputValidationService:
             suggestion_threshold=0.4,
         )
 
-        assert service.regions == set(sample_regions)
+        assert service.regions == frozenset(sample_regions)
         assert service.max_message_length == 1000
         assert service.fuzzy_match_threshold == 0.7
         assert service.suggestion_threshold == 0.4
 
+    def test_init_reuses_frozenset_regions(self, sample_regions):
+        """Test that a frozenset of regions is kept without being copied."""
+        regions = frozenset(sample_regions)
+        service = InputValidationService(regions=regions)
+
+        assert service.regions is regions
+
+    def test_validation_result_is_immutable(self):
+        """Test that validation results cannot be modified after creation."""
+        result = ValidationResult.valid("Lombardia")
+
+        with pytest.raises(FrozenInstanceError):
+            result.is_valid = False
+
     def test_validate_message_valid(self, validation_service):
         """Test validating a valid message."""
         result = validation_service.validate_message("Hello, how are you?")
@@ -264,26 +302,60 @@ class TestInputValidationService:
 
         assert result.is_valid is False
 
-    def test_validate_region_valid(self, validation_service):
-        """Test validating a valid region."""
-        result = validation_service.validate_region("Lombardia")
-
+    @pytest.mark.parametrize(
+        "region, is_valid, normalized_value",
+        [
+            pytest.param("Lombardia", True, "Lombardia", id="exact"),
+            pytest.param("lombardia", True, "Lombardia", id="case_insensitive"),
+            pytest.param("  LOMBARDIA ", True, "Lombardia", id="upper_case_padded"),
+            pytest.param("NonExistent", False, None, id="no_match"),
+        ],
+    )
+    def test_validate_region(self, validation_service, region, is_valid, normalized_value):
+        """Test region validation for exact, case-insensitive and unknown names."""
+        result = validation_service.validate_region(region)
+
+        assert result.is_valid is is_valid
+        assert result.normalized_value == normalized_value
+        if not is_valid:
+            assert result.suggestions is not None
+
+    def test_validate_region_fuzzy_match(self, validation_service):
+        """Test region validation with typos and misspelled aliases."""
+        result = validation_service.validate_region("Lombrdia")
         assert result.is_valid is True
         assert result.normalized_value == "Lombardia"
 
-    def test_validate_region_case_insensitive(self, validation_service):
-        """Test region validation with case insensitive matching."""
-        result = validation_service.validate_region("lombardia")
+        result = validation_service.validate_region("milan0")
+        assert result.is_valid is False
+        assert result.suggestions == ["Lombardia"]
 
-        assert result.is_valid is True
-        assert result.normalized_value == "Lombardia"
+    def test_detect_spam_excessive_punctuation(self, validation_service):
+        """Test spam detection on punctuation-heavy ASCII and non-ASCII text."""
+        assert validation_service.detect_spam("!?!?!?!? ciao !?!?!?").is_valid is False
+        assert validation_service.detect_spam("Perché non funziona?").is_valid is True
 
-    def test_validate_region_no_match(self, validation_service):
-        """Test region validation with no match."""
-        result = validation_service.validate_region("NonExistent")
+    def test_sorted_regions_follow_updates(self, validation_service):
+        """Test that the cached sorted regions are refreshed by update_regions."""
+        assert list(validation_service.sorted_regions) == sorted(validation_service.regions)
 
-        assert result.is_valid is False
-        assert result.suggestions is not None
+        validation_service.update_regions(["Veneto", "Abruzzo", "Lazio"])
+
+        assert validation_service.sorted_regions == ("Abruzzo", "Lazio", "Veneto")
+        assert validation_service.get_popular_regions(2) == ["Abruzzo", "Lazio"]
+
+    def test_normalize_text(self, validation_service):
+        """Test accent, apostrophe and separator normalization."""
+        assert validation_service._normalize_text("  Città-di_Prova ") == "citta di prova"
+        assert validation_service._normalize_text("Valle d\u2019Aosta") == "valle d'aosta"
+        assert validation_service._normalize_text("") == ""
+        assert validation_service._normalize_text("LOMBARDIA") == "lombardia"
+
+    def test_normalize_for_lookup_matches_sanitize_and_normalize(self, validation_service):
+        """Test that the single-step lookup normalization matches the two-step path."""
+        for text in ["  Lomb\x00ardia\n", "emilia\tromagna", "Èmilia-Romagna"]:
+            expected = validation_service._normalize_text(validation_service.sanitize_input(text))
+            assert validation_service._normalize_for_lookup(text) == expected
 
 
 class TestClassificationService:
@@ -301,6 +373,23 @@ class TestClassificationService:
         assert service.ollama_host == "http://localhost:11434"
         assert service.model == "llama3.1:8b"
         assert service.timeout == 30
+        assert service._chat_url == "http://localhost:11434/api/chat"
+
+    def test_max_concurrency_from_environment(self, monkeypatch):
+        """Test that LLM concurrency defaults to OLLAMA_NUM_PARALLEL."""
+        monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+
+        assert ClassificationService().max_concurrency == 2
+        assert ClassificationService(max_concurrency=8).max_concurrency == 8
+
+    def test_session_is_created_lazily(self, classifier_service):
+        """Test that the HTTP session is only built on first use and then reused."""
+        assert classifier_service._session is None
+
+        session = classifier_service.session
+
+        assert session is classifier_service.session
+        assert session.get_adapter("http://localhost:11434")._pool_block is True
 
     def test_build_system_prompt(self, classifier_service):
         """Test system prompt building."""
@@ -311,33 +400,182 @@ class TestClassificationService:
         assert "intent" in prompt.lower()
 
     @pytest.mark.asyncio
-    async def test_classify_async(self, classifier_service):
+    async def test_classify_async(self, classifier_service, monkeypatch):
         """Test async classification."""
-        with patch.object(classifier_service, "_classify_internal") as mock_classify:
+        monkeypatch.setattr(
+            classifier_service,
+            "_classify_internal",
+            lambda *_: '{"intent":"greeting","region":null,"confidence":0.95,"needs_region":false}',
+        )
+
+        result = await classifier_service.classify_async("Hello")
+
+        assert isinstance(result, ClassificationResult)
+        assert result.intent == "greeting"
+        # The actual implementation might normalize confidence to 1.0 for valid responses
+        assert result.confidence > 0
+
+    @pytest.mark.asyncio
+    async def test_classify_async_fast_path(self, classifier_service):
+        """Test that bare trigger phrases are classified without the LLM."""
+        with patch.object(classifier_service, "_cached_classify") as mock_classify:
             mock_classify.return_value = (
-                '{"intent":"greeting","region":null,"confidence":0.95,"needs_region":false}'
+                '{"intent":"bollo_auto","region":null,"confidence":0.9,"needs_region":true}'
             )
 
-            result = await classifier_service.classify_async("Hello")
+            greeting = await classifier_service.classify_async("Ciao!")
+            help_result = await classifier_service.classify_async("  Cosa sai fare? ")
+            bollo = await classifier_service.classify_async("Ciao, dove pago il bollo?")
 
-            assert isinstance(result, ClassificationResult)
-            assert result.intent == "greeting"
-            # The actual implementation might normalize confidence to 1.0 for valid responses
-            assert result.confidence > 0
+            assert greeting.intent == "greeting"
+            assert help_result.intent == "help"
+            assert bollo.intent == "bollo_auto"
+            assert mock_classify.call_count == 1
 
-    def test_classify_sync(self, classifier_service):
-        """Test sync classification."""
+    @pytest.mark.asyncio
+    async def test_classify_async_coalesces_concurrent_requests(self, classifier_service):
+        """Test that concurrent identical classifications share one LLM call."""
+
+        def slow_classify(cache_key, text):
+            time.sleep(0.05)
+            return '{"intent":"bollo_auto","region":null,"confidence":0.95,"needs_region":true}'
+
+        with patch.object(
+            classifier_service, "_cached_classify", side_effect=slow_classify
+        ) as mock_classify:
+            results = await asyncio.gather(
+                *(classifier_service.classify_async("Bollo auto") for _ in range(5))
+            )
+
+            assert mock_classify.call_count == 1
+            assert all(result.intent == "bollo_auto" for result in results)
+            assert classifier_service._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_classify_batch(self, classifier_service):
+        """Test batch classification keeps order and deduplicates LLM calls."""
+
+        def fake_classify(cache_key, text):
+            intent = "patente" if text == "Rinnovo patente" else "bollo_auto"
+            return f'{{"intent":"{intent}","region":null,"confidence":0.9,"needs_region":false}}'
+
+        with patch.object(
+            classifier_service, "_cached_classify", side_effect=fake_classify
+        ) as mock_classify:
+            results = await classifier_service.classify_batch(
+                ["Bollo auto", "Rinnovo patente", "Bollo auto"]
+            )
+
+            assert [result.intent for result in results] == ["bollo_auto", "patente", "bollo_auto"]
+            assert mock_classify.call_count == 2
+
+    def test_classify_cache_ignores_case_and_whitespace(self, classifier_service):
+        """Test that messages differing only in case or padding share a cache entry."""
         with patch.object(classifier_service, "_classify_internal") as mock_classify:
             mock_classify.return_value = (
                 '{"intent":"greeting","region":null,"confidence":0.95,"needs_region":false}'
             )
 
-            result = classifier_service.classify_sync("Hello")
+            classifier_service.classify_sync("Hello")
+            result = classifier_service.classify_sync("  hello ")
 
-            assert isinstance(result, ClassificationResult)
             assert result.intent == "greeting"
-            # The actual implementation might normalize confidence to 1.0 for valid responses
-            assert result.confidence > 0
+            assert mock_classify.call_count == 1
+
+    def test_classify_failure_is_negatively_cached(self, classifier_service):
+        """Test that a failed classification is cached instead of retried."""
+        with patch.object(
+            classifier_service, "_classify_internal", side_effect=TimeoutError("timeout")
+        ) as mock_classify:
+            first = classifier_service.classify_sync("Hello")
+            second = classifier_service.classify_sync("Hello")
+
+            assert first.intent == "unknown"
+            assert second.intent == "unknown"
+            assert mock_classify.call_count == 1
+            assert classifier_service.get_cache_stats()["failure_currsize"] == 1
+
+    def test_classify_internal_uses_json_mode(self, classifier_service):
+        """Test that classification requests constrained JSON and parse it directly."""
+        response = Mock()
+        response.content = json.dumps(
+            {"message": {"content": '{"intent":"spid","confidence":0.9}'}}
+        ).encode()
+
+        with patch.object(classifier_service, "_post_chat", return_value=response) as mock_post:
+            text = 'Com\'è fatto lo "SPID"?'
+            result = json.loads(classifier_service._classify_internal("hash", text))
+
+            payload = json.loads(mock_post.call_args.args[0])
+            assert payload["messages"][1] == {"role": "user", "content": text}
+            assert payload["format"] == "json"
+            assert payload["options"]["num_predict"] > 0
+            assert result == {
+                "intent": "spid",
+                "confidence": 0.9,
+                "region": None,
+                "needs_region": False,
+            }
+
+    def test_classify_stream_yields_parsed_chunks(self, classifier_service):
+        """Test that streamed NDJSON lines are parsed into dictionaries."""
+        response = Mock()
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+        response.iter_lines.return_value = [b'{"done":false}', b"", b'{"done":true}']
+
+        with patch.object(classifier_service, "_post_chat", return_value=response):
+            chunks = list(classifier_service.classify_stream("Ciao"))
+
+        assert chunks == [{"done": False}, {"done": True}]
+
+        with patch.object(classifier_service, "_post_chat", side_effect=TimeoutError("timeout")):
+            chunks = list(classifier_service.classify_stream("Ciao"))
+
+        assert chunks == [{"error": "Classification failed: timeout"}]
+
+    def test_warm_up_sends_system_prompt_only(self, classifier_service):
+        """Test that warm-up prefills the system prompt and keeps the model loaded."""
+        with patch.object(classifier_service, "_post_chat") as mock_post:
+            assert classifier_service.warm_up() is True
+
+            payload = mock_post.call_args.args[0]
+            assert payload["messages"] == [
+                {"role": "system", "content": classifier_service.system_prompt}
+            ]
+            assert payload["keep_alive"] == classifier_service.keep_alive
+
+        with patch.object(classifier_service, "_post_chat", side_effect=TimeoutError("timeout")):
+            assert classifier_service.warm_up() is False
+
+    def test_classify_sync(self, classifier_service, monkeypatch):
+        """Test sync classification."""
+        monkeypatch.setattr(
+            classifier_service,
+            "_classify_internal",
+            lambda *_: '{"intent":"greeting","region":null,"confidence":0.95,"needs_region":false}',
+        )
+
+        result = classifier_service.classify_sync("Hello")
+
+        assert isinstance(result, ClassificationResult)
+        assert result.intent == "greeting"
+        # The actual implementation might normalize confidence to 1.0 for valid responses
+        assert result.confidence > 0
+
+    def test_classify_sync_times_out(self, classifier_service, monkeypatch):
+        """Test that a stalled classification returns the fallback instead of hanging."""
+
+        async def stalled(text):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(classifier_service, "classify_async", stalled)
+        classifier_service.timeout = 0.05
+
+        result = classifier_service.classify_sync("Hello")
+
+        assert result.intent == "unknown"
+        assert result.confidence == 0.0
 
 
 class TestResponseFormatterService:
@@ -353,41 +591,455 @@ class TestResponseFormatterService:
         assert service.regions_per_message == 10
         assert service.default_language == "en"
 
-    def test_format_links_response_with_entries(self, sample_catalog_entries):
+    def test_format_links_response_with_entries(self, formatter_service, sample_catalog_entries):
         """Test formatting links response with valid entries."""
-        service = ResponseFormatterService(max_links=3)
+        result = formatter_service.format_links_response(
+            sample_catalog_entries, "fascicolo_sanitario", "it", max_links=3
+        )
+
+        assert "Fascicolo Sanitario" in result
+        assert "FSE Lombardia" in result
+        assert "https://" in result
+
+    def test_format_links_response_empty_list(self, formatter_service):
+        """Test formatting links response with empty list."""
+        result = formatter_service.format_links_response([], "test_intent", "it")
+
+        assert len(result) > 0  # Should return some error message
+
+    def test_format_links_response_limit_entries(self, formatter_service, sample_catalog_entries):
+        """Test that formatting respects the max_links limit and its per-call override."""
+        default_result = formatter_service.format_links_response(
+            sample_catalog_entries, "test_intent", "it"
+        )
+        result = formatter_service.format_links_response(
+            sample_catalog_entries, "test_intent", "it", max_links=2
+        )
+
+        # Count bullet points (links)
+        assert default_result.count("•") == len(sample_catalog_entries)
+        assert result.count("•") == 2
+
+    def test_format_links_response_zero_max_links(self, formatter_service, sample_catalog_entries):
+        """Test that an explicit max_links=0 includes no links rather than the default."""
+        result = formatter_service.format_links_response(
+            sample_catalog_entries, "test_intent", "it", max_links=0
+        )
+
+        assert "•" not in result
+        assert result == formatter_service.format_links_response([], "test_intent", "it")
+
+    def test_static_responses_are_cached_per_language(self):
+        """Test that static responses are rendered once per language."""
+        service = ResponseFormatterService()
 
-        with patch("utils.i18n.get_translator") as mock_translator:
-            mock_translator.return_value = lambda x: x  # Return text as-is
+        help_text = service.format_help_response("it")
+        assert service.format_help_response("it") is help_text
+        assert service.format_greeting_response("en") in service._greetings_cache["en"]
+        assert set(service._help_cache) == {"it", "en"}  # Prewarmed at init
 
-            result = service.format_links_response(
-                sample_catalog_entries, "fascicolo_sanitario", "it"
+    def test_get_parse_mode(self, formatter_service):
+        """Test parse mode detection for Markdown, HTML and plain text."""
+        service = formatter_service
+
+        assert service.get_parse_mode("**Bold** text") == ParseMode.MARKDOWN
+        assert service.get_parse_mode("see [link](https://example.com)") == ParseMode.MARKDOWN
+        assert service.get_parse_mode("<b>Bold</b> text") == ParseMode.HTML
+        assert service.get_parse_mode("Plain text") is None
+
+    def test_format_links_response_truncates_long_messages(self, formatter_service):
+        """Test that oversized link lists are cut before the safe length."""
+        entries = [
+            CatalogEntry(
+                intent="test_intent",
+                region="Nazionale",
+                label=f"Link {i}",
+                url=f"https://example.com/{'x' * 200}/{i}",
             )
+            for i in range(50)
+        ]
 
-            assert "Fascicolo Sanitario" in result
-            assert "FSE Lombardia" in result
-            assert "https://" in result
+        result = formatter_service.format_links_response(
+            entries, "test_intent", "it", max_links=100
+        )
 
-    def test_format_links_response_empty_list(self):
-        """Test formatting links response with empty list."""
+        assert len(result) <= SAFE_MESSAGE_LENGTH + len("\n...")
+        assert result.endswith("\n...")
+
+    def test_format_stats_response(self):
+        """Test formatting stats with partial data and a cached template."""
         service = ResponseFormatterService()
+        stats_data = {"index": {"total_entries": 42, "intents": 5}, "cache": {"hits": 7}}
+
+        result = service.format_stats_response(stats_data, "it")
+
+        assert "42" in result
+        assert service.format_stats_response(stats_data, "it") == result
+        assert set(service._stats_format_cache) == {"it", "en"}  # Prewarmed at init
+
+    def test_format_region_prompts(self, formatter_service):
+        """Test region request and suggestion messages."""
+        service = formatter_service
+
+        request = service.format_region_request(["Lazio", "Lombardia", "Puglia", "Veneto"], "it")
+        assert "Lazio, Lombardia, Puglia" in request
+        assert "Veneto" not in request
+
+        suggestions = service.format_region_suggestions("Lombrdia", ["Lombardia"], "it")
+        assert "Lombrdia" in suggestions
+        assert "Lombardia" in suggestions
+        assert "Lombrdia" in service.format_region_suggestions("Lombrdia", [], "it")
+
+    def test_format_error_response_falls_back_to_generic(self, formatter_service):
+        """Test that unknown keys and bad format arguments yield the generic error."""
+        service = formatter_service
+        generic = service.format_error_response("generic", "it")
+
+        assert service.format_error_response("does_not_exist", "it") == generic
+        assert service.format_error_response("message_too_long", "it") == generic
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_limits_requests_per_window(self, monkeypatch):
+        """Test that bursts beyond the limit are refused until tokens refill."""
+        now = [1000.0]
+        monkeypatch.setattr("utils.decorators.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(max_requests=2, window_seconds=10)
+
+        assert limiter.is_allowed(1) is True
+        now[0] += 1
+        assert limiter.is_allowed(1) is True
+        assert limiter.is_allowed(1) is False
+        assert limiter.is_allowed(2) is True
+        assert limiter.get_reset_time(1) == pytest.approx(4.0)
+        assert limiter.get_reset_time(3) is None
+
+        now[0] += 5
+        assert limiter.is_allowed(1) is True
+        assert limiter.is_allowed(1) is False
 
-        with patch("utils.i18n.get_translator") as mock_translator:
-            mock_translator.return_value = lambda x: x
+    def test_idle_users_are_swept(self, monkeypatch):
+        """Test that users idle for a full window are forgotten on the next sweep."""
+        now = [1000.0]
+        monkeypatch.setattr("utils.decorators.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(max_requests=2, window_seconds=10, cleanup_interval=5)
+
+        limiter.is_allowed(1)
+        now[0] += 6
+        limiter.is_allowed(2)
+        assert set(limiter.buckets) == {1, 2}
+
+        now[0] += 6
+        limiter.is_allowed(2)
+        assert set(limiter.buckets) == {2}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_holds_under_concurrent_updates(self):
+        """Test that concurrent updates from one user can't exceed the burst limit."""
+        handled = []
+
+        @rate_limit(max_requests=3, window_seconds=60)
+        async def handler(update, context):
+            await asyncio.sleep(0)
+            handled.append(update.effective_user.id)
+
+        update = Mock()
+        update.effective_user.id = 42
+        update.effective_user.language_code = "en"
+        update.message.reply_text = AsyncMock()
+
+        await asyncio.gather(*(handler(update, None) for _ in range(10)))
+
+        assert handled == [42, 42, 42]
+        assert update.message.reply_text.await_count == 7
+
+
+class TestCacheResult:
+    """Test cases for the cache_result decorator."""
+
+    def test_caches_by_arguments_and_evicts_lru(self):
+        """Test hits regardless of keyword order and eviction of the LRU entry."""
+        calls = []
+
+        @cache_result(ttl_seconds=60, maxsize=2)
+        def add(a, b=0, c=0):
+            calls.append((a, b, c))
+            return a + b + c
+
+        assert add(1, b=2, c=3) == 6
+        assert add(1, c=3, b=2) == 6
+        assert len(calls) == 1
+
+        add(2)
+        add(3)  # Evicts the least recently used entry, add(1, b=2, c=3)
+        add(1, b=2, c=3)
+        assert len(calls) == 4
+        assert len(add.cache) == 2
+
+    def test_unhashable_arguments_skip_cache(self):
+        """Test that calls with unhashable arguments are computed without caching."""
+
+        @cache_result(ttl_seconds=60)
+        def size(items):
+            return len(items)
+
+        assert size([1, 2]) == 2
+        assert size(items=[1, 2, 3]) == 3
+        assert len(size.cache) == 0
+
+
+class TestI18n:
+    """Test cases for translator lookup."""
+
+    def test_translators_are_cached_per_base_language(self):
+        """Test that language variants share one cached translator."""
+        translator = get_translator("it")
+
+        assert get_translator("it-IT") is translator
+        assert get_translator("IT") is translator
+        assert get_translator(None) is get_translator("en")
+        assert translator("Ciao") == "Ciao"
+
+
+class TestHandleTelegramErrors:
+    """Test cases for the handle_telegram_errors decorator."""
+
+    @pytest.mark.asyncio
+    async def test_error_reply_does_not_block_handler(self, mock_telegram_update):
+        """Test that the error reply is sent in the background after the handler returns."""
+        reply_sent = asyncio.Event()
 
-            result = service.format_links_response([], "test_intent", "it")
+        async def slow_reply(text):
+            await asyncio.sleep(0.01)
+            reply_sent.set()
 
-            assert len(result) > 0  # Should return some error message
+        mock_telegram_update.effective_user.language_code = "it"
+        mock_telegram_update.message.reply_text = slow_reply
 
-    def test_format_links_response_limit_entries(self, sample_catalog_entries):
-        """Test that formatting respects max_links limit."""
-        service = ResponseFormatterService(max_links=2)
+        @handle_telegram_errors
+        async def handler(update, context):
+            raise RuntimeError("boom")
 
-        with patch("utils.i18n.get_translator") as mock_translator:
-            mock_translator.return_value = lambda x: x
+        await handler(mock_telegram_update, None)
+        assert not reply_sent.is_set()
 
-            result = service.format_links_response(sample_catalog_entries, "test_intent", "it")
+        await asyncio.wait_for(reply_sent.wait(), timeout=1)
+
+
+class TestLogHandlerCall:
+    """Test cases for the log_handler_call decorator."""
+
+    @pytest.mark.asyncio
+    async def test_logs_caller_and_truncated_message(self, mock_telegram_update, caplog):
+        """Test that the handler call is logged with a truncated message preview."""
+
+        @log_handler_call
+        async def handler(update, context):
+            return "done"
+
+        mock_telegram_update.message.text = "x" * 60
+
+        with caplog.at_level("INFO", logger="utils.decorators"):
+            assert await handler(mock_telegram_update, None) == "done"
+
+        assert f"Message: '{'x' * 50}...'" in caplog.text
+
+
+class TestTelegramHandler:
+    """Test cases for the fused telegram_handler decorator."""
+
+    @pytest.mark.asyncio
+    async def test_calls_handler_for_valid_update(self, mock_telegram_update):
+        """Test that a valid update reaches the handler and its result is returned."""
+
+        @telegram_handler
+        async def handler(update, context):
+            return "done"
+
+        assert await handler(mock_telegram_update, None) == "done"
+
+    @pytest.mark.asyncio
+    async def test_skips_update_without_chat(self, mock_telegram_update):
+        """Test that updates without an effective chat are dropped."""
+        handler_mock = AsyncMock()
+        mock_telegram_update.effective_chat = None
+
+        await telegram_handler(handler_mock)(mock_telegram_update, None)
+
+        handler_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_error_is_answered_not_raised(self, mock_telegram_update):
+        """Test that handler errors are swallowed and answered with the generic message."""
+        mock_telegram_update.effective_user.language_code = "it"
+        mock_telegram_update.message.reply_text = AsyncMock()
+
+        @telegram_handler
+        async def handler(update, context):
+            raise RuntimeError("boom")
+
+        assert await handler(mock_telegram_update, None) is None
+        await asyncio.sleep(0)
+
+        mock_telegram_update.message.reply_text.assert_awaited_once()
+
+
+class TestSetupLogging:
+    """Test cases for logging configuration."""
+
+    @pytest.fixture
+    def restore_root_logger(self):
+        """Restore the root logger's handlers and level after the test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield root
+        stop_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_records_are_written_through_queue(self, restore_root_logger, tmp_path):
+        """Test that the root logger only enqueues and the listener writes to file."""
+        log_file = tmp_path / "bot.log"
+
+        setup_logging("INFO", "development", str(log_file))
+        logging.getLogger("tests").info("queued record")
+        stop_logging()
+
+        assert len(restore_root_logger.handlers) == 1
+        assert isinstance(restore_root_logger.handlers[0], QueueHandler)
+        assert "queued record" in log_file.read_text(encoding="utf-8")
+
+    def test_file_is_opened_lazily_and_flushed_on_stop(self, restore_root_logger, tmp_path):
+        """Test that the log file isn't created before a record and buffers flush on stop."""
+        log_file = tmp_path / "bot.log"
+
+        setup_logging("WARNING", "development", str(log_file))
+        assert not log_file.exists()
+
+        logging.getLogger("tests").warning("buffered record")
+        stop_logging()
+
+        assert "buffered record" in log_file.read_text(encoding="utf-8")
+
+    def test_stop_logging_closes_log_file(self, restore_root_logger, tmp_path):
+        """Test that stopping logging closes the rotating file handler's stream."""
+        setup_logging("WARNING", "development", str(tmp_path / "bot.log"))
+        listener = utils_logging._queue_listener
+        (buffered_handler,) = [h for h in listener.handlers if isinstance(h, MemoryHandler)]
+        file_handler = buffered_handler.target
+
+        logging.getLogger("tests").warning("opens the file")
+        stop_logging()
+
+        assert file_handler.stream is None or file_handler.stream.closed
+
+    def test_production_logs_keep_exception_field(self, restore_root_logger, tmp_path):
+        """Test that tracebacks reach the JSON exception field through the queue."""
+        log_file = tmp_path / "bot.log"
+
+        setup_logging("INFO", "production", str(log_file))
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("tests").error("handler failed", exc_info=True)
+        stop_logging()
+
+        (data,) = [
+            json.loads(line)
+            for line in log_file.read_text(encoding="utf-8").splitlines()
+            if "handler failed" in line
+        ]
+        assert data["message"] == "handler failed"
+        assert "ValueError: boom" in data["exception"]
+
+    def test_json_formatter_escapes_messages(self):
+        """Test that production log lines stay valid JSON for any message."""
+        record = logging.LogRecord(
+            "tests", logging.INFO, __file__, 10, 'said "ciao" \\ %s', ("bye",), None
+        )
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["message"] == 'said "ciao" \\ bye'
+        assert data["level"] == "INFO"
+        assert data["line"] == 10
+
+
+class TestLoggerMixin:
+    """Test cases for LoggerMixin."""
+
+    def test_logger_is_per_subclass(self):
+        """Test that each subclass gets its own module-qualified logger."""
+
+        class Parent(LoggerMixin):
+            pass
+
+        class Child(Parent):
+            pass
+
+        assert Parent().logger.name == f"{__name__}.Parent"
+        assert Child().logger.name == f"{__name__}.Child"
+
+
+class TestRetry:
+    """Test cases for the retry decorator."""
+
+    @pytest.mark.asyncio
+    async def test_async_retry_until_success(self):
+        """Test that coroutines are retried and awaited on each attempt."""
+        calls = []
+
+        @retry(max_attempts=3, delay_seconds=0, exceptions=(ValueError,))
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("boom")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_retry_inside_event_loop_warns(self):
+        """Test that blocking sync retries from a running loop are flagged."""
+        calls = []
+
+        @retry(max_attempts=2, delay_seconds=0, exceptions=(ValueError,))
+        def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise ValueError("boom")
+            return "ok"
+
+        with pytest.warns(RuntimeWarning, match="blocks the running event loop"):
+            assert flaky() == "ok"
+
+    def test_sync_retry_does_not_sleep_after_last_attempt(self):
+        """Test that exhausting all attempts only sleeps between attempts."""
+
+        @retry(max_attempts=3, delay_seconds=0.05, backoff_factor=2.0, exceptions=(ValueError,))
+        def always_fails():
+            raise ValueError("boom")
+
+        start = time.monotonic()
+        with pytest.raises(ValueError):
+            always_fails()
+
+        # Sleeps of 0.05s and 0.1s; a final sleep would add another 0.2s
+        assert time.monotonic() - start < 0.15 + 0.1
+
+    @pytest.mark.asyncio
+    async def test_async_retry_does_not_sleep_after_last_attempt(self):
+        """Test that exhausting all async attempts only sleeps between attempts."""
+
+        @retry(max_attempts=3, delay_seconds=0.05, backoff_factor=2.0, exceptions=(ValueError,))
+        async def always_fails():
+            raise ValueError("boom")
+
+        start = time.monotonic()
+        with pytest.raises(ValueError):
+            await always_fails()
 
-            # Count bullet points (links)
-            bullet_points = result.count("•")
-            assert bullet_points <= 2
+        assert time.monotonic() - start < 0.15 + 0.1
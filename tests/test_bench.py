@@ -0,0 +1,27 @@
+"""
+Performance benchmarks for PAstaLinkBot hot paths.
+
+These run only when selected with '-m benchmark' and require pytest-benchmark.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.benchmark
+def test_bench_get_links(catalog_service, benchmark):
+    """Benchmark catalog lookups for an intent and region."""
+    benchmark(catalog_service.get_links, "fascicolo_sanitario", "Lombardia")
+
+
+@pytest.mark.benchmark
+def test_bench_validate_message(validation_service, benchmark):
+    """Benchmark validation of a typical user message."""
+    benchmark(validation_service.validate_message, "Come rinnovo la patente in Lombardia?")
+
+
+@pytest.mark.benchmark
+def test_bench_validate_region(validation_service, benchmark):
+    """Benchmark region validation with a case-insensitive exact match."""
+    benchmark(validation_service.validate_region, "lombardia")
@@ -11,18 +11,25 @@ from .decorators import (
     rate_limit,
     require_admin,
     retry,
+    telegram_handler,
     validate_update,
 )
-from .logging import LoggerMixin, get_logger, setup_logging
+from .helpers import TTLCache, json_dumps, json_loads
+from .logging import LoggerMixin, get_logger, setup_logging, stop_logging
 
 __all__ = [
     "setup_logging",
+    "stop_logging",
     "get_logger",
     "LoggerMixin",
+    "TTLCache",
+    "json_loads",
+    "json_dumps",
     "handle_telegram_errors",
     "require_admin",
     "log_handler_call",
     "rate_limit",
     "retry",
+    "telegram_handler",
     "validate_update",
 ]
@@ -8,6 +8,7 @@ Decorators:
     handle_telegram_errors: Error handling for Telegram handlers
     require_admin: Restrict commands to admin users
     log_handler_call: Log Telegram handler calls
+    telegram_handler: Fused error handling, call logging and update validation
     rate_limit: Simple rate limiting decorator
     retry: Retry decorator for unreliable operations
 """
@@ -16,17 +17,44 @@ import asyncio
 import functools
 import logging
 import time
-from collections import defaultdict
-from typing import Any, Callable, Dict, Optional, Set
+import warnings
+from typing import Any, Callable, Coroutine, Dict, Optional, Set, Tuple
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from config.constants import ERROR_MESSAGES
+from utils.helpers import TTLCache
 from utils.i18n import get_translator
 
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget tasks, so they aren't garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _run_in_background(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Schedule a coroutine without awaiting it, logging any failure.
+
+    Args:
+        coro: Coroutine to run on the current event loop
+
+    Returns:
+        asyncio.Task: The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Release a finished background task and log its exception, if any."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Failed to send error message to user: {task.exception()}")
+
 
 def handle_telegram_errors(func: Callable) -> Callable:
     """
@@ -48,25 +76,31 @@ def handle_telegram_errors(func: Callable) -> Callable:
             return await func(update, context)
         except Exception as e:
             logger.error(f"Error in {func.__name__}: {e}", exc_info=True)
+            _send_error_reply(update, update.effective_user)
 
-            # Try to send error message to user
-            try:
-                user_lang = None
-                if update.effective_user:
-                    user_lang = update.effective_user.language_code
+    return wrapper
 
-                _ = get_translator(user_lang)
-                error_message = _(ERROR_MESSAGES["generic"])
 
-                if update.message:
-                    await update.message.reply_text(error_message)
-                elif update.callback_query:
-                    await update.callback_query.answer(error_message)
+def _send_error_reply(update: Update, user: Any) -> None:
+    """
+    Send the generic error message to the user without awaiting it.
 
-            except Exception as nested_e:
-                logger.error(f"Failed to send error message to user: {nested_e}")
+    Args:
+        update: Telegram update the failed handler was processing
+        user: The update's effective user, if any
+    """
+    try:
+        _ = get_translator(user.language_code if user else None)
+        error_message = _(ERROR_MESSAGES["generic"])
 
-    return wrapper
+        # Send without awaiting, so a slow Telegram API doesn't hold up the handler
+        if update.message:
+            _run_in_background(update.message.reply_text(error_message))
+        elif update.callback_query:
+            _run_in_background(update.callback_query.answer(error_message))
+
+    except Exception as nested_e:
+        logger.error(f"Failed to send error message to user: {nested_e}")
 
 
 def require_admin(admin_user_ids: Set[int]) -> Callable:
@@ -111,57 +145,100 @@ def log_handler_call(func: Callable) -> Callable:
         Callable: Wrapped handler function
     """
 
+    # Bound once here so the per-update path reads closure cells, not globals
+    name = func.__name__
+    is_enabled_for = logger.isEnabledFor
+    clock = time.monotonic
+
     @functools.wraps(func)
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        # Extract user and message info
-        user_id = update.effective_user.id if update.effective_user else "unknown"
-        username = update.effective_user.username if update.effective_user else "unknown"
-        chat_id = update.effective_chat.id if update.effective_chat else "unknown"
-
-        message_text = ""
-        if update.message and update.message.text:
-            # Log first 50 chars of message for context
-            message_text = update.message.text[:50]
-            if len(update.message.text) > 50:
-                message_text += "..."
-
-        logger.info(
-            f"Handler {func.__name__} called by user {user_id} (@{username}) "
-            f"in chat {chat_id}. Message: '{message_text}'"
-        )
-
-        start_time = time.time()
+        # Only gather user and message info when the record will actually be emitted
+        if is_enabled_for(logging.INFO):
+            _log_call(name, update.effective_user, update.effective_chat, update.message)
+
+        start_time = clock()
         try:
             result = await func(update, context)
-            duration = time.time() - start_time
-            logger.debug(f"Handler {func.__name__} completed in {duration:.3f}s")
+            if is_enabled_for(logging.DEBUG):
+                logger.debug(f"Handler {name} completed in {clock() - start_time:.3f}s")
             return result
         except Exception as e:
-            duration = time.time() - start_time
-            logger.error(f"Handler {func.__name__} failed after {duration:.3f}s: {e}")
+            duration = clock() - start_time
+            logger.error(f"Handler {name} failed after {duration:.3f}s: {e}")
             raise
 
     return wrapper
 
 
+def _log_call(handler_name: str, user: Any, chat: Any, message: Any) -> None:
+    """
+    Log a handler call with user, chat and message preview.
+
+    Args:
+        handler_name: Name of the called handler
+        user: The update's effective user, if any
+        chat: The update's effective chat, if any
+        message: The update's message, if any
+    """
+    user_id = user.id if user else "unknown"
+    username = user.username if user else "unknown"
+    chat_id = chat.id if chat else "unknown"
+
+    # Log first 50 chars of message for context
+    text = message.text if message else None
+    message_text = f"{text[:50]}..." if text and len(text) > 50 else (text or "")
+
+    logger.info(
+        f"Handler {handler_name} called by user {user_id} (@{username}) "
+        f"in chat {chat_id}. Message: '{message_text}'"
+    )
+
+
 class RateLimiter:
     """
     Simple rate limiter for preventing spam.
 
-    Tracks requests per user and enforces limits.
+    Uses a token bucket per user: each user can burst up to max_requests,
+    and tokens refill continuously at max_requests per window_seconds.
     """
 
-    def __init__(self, max_requests: int = 10, window_seconds: int = 60):
+    def __init__(
+        self,
+        max_requests: int = 10,
+        window_seconds: int = 60,
+        cleanup_interval: float = 60.0,
+        max_idle_seconds: Optional[float] = None,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             max_requests: Maximum requests per window
             window_seconds: Time window in seconds
+            cleanup_interval: Minimum seconds between sweeps of idle users
+            max_idle_seconds: Seconds without requests after which a user is forgotten,
+                defaults to (and is never less than) window_seconds
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[int, list] = defaultdict(list)
+        self.refill_per_second = max_requests / window_seconds
+        # (tokens, last update time) per user
+        self.buckets: Dict[int, Tuple[float, float]] = {}
+
+        # A bucket idle for a full window has refilled completely, so forgetting
+        # it is indistinguishable from keeping it; shorter idle times would not be
+        self.cleanup_interval = cleanup_interval
+        self.max_idle_seconds = max(max_idle_seconds or window_seconds, window_seconds)
+        self._last_sweep = time.monotonic()
+
+    def _refill(self, user_id: int, now: float) -> float:
+        """Get the user's current token count, refilled up to now."""
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            return float(self.max_requests)
+
+        tokens, last = bucket
+        return min(self.max_requests, tokens + (now - last) * self.refill_per_second)
 
     def is_allowed(self, user_id: int) -> bool:
         """
@@ -173,22 +250,30 @@ class RateLimiter:
         Returns:
             bool: True if request is allowed, False otherwise
         """
-        now = time.time()
-        user_requests = self.requests[user_id]
+        now = time.monotonic()
+        if now - self._last_sweep > self.cleanup_interval:
+            self._sweep(now)
 
-        # Remove old requests outside the window
-        user_requests[:] = [
-            req_time for req_time in user_requests if now - req_time < self.window_seconds
-        ]
+        tokens = self._refill(user_id, now)
 
-        # Check if under limit
-        if len(user_requests) >= self.max_requests:
+        if tokens < 1.0:
+            self.buckets[user_id] = (tokens, now)
             return False
 
-        # Add current request
-        user_requests.append(now)
+        self.buckets[user_id] = (tokens - 1.0, now)
         return True
 
+    def _sweep(self, now: float) -> None:
+        """Forget users idle for longer than max_idle_seconds, so memory stays bounded."""
+        cutoff = now - self.max_idle_seconds
+        idle_users = [user_id for user_id, (_, last) in self.buckets.items() if last <= cutoff]
+        for user_id in idle_users:
+            del self.buckets[user_id]
+
+        self._last_sweep = now
+        if idle_users:
+            logger.debug(f"Rate limiter evicted {len(idle_users)} idle users")
+
     def get_reset_time(self, user_id: int) -> Optional[float]:
         """
         Get time until rate limit resets for user.
@@ -197,20 +282,13 @@ class RateLimiter:
             user_id: Telegram user ID
 
         Returns:
-            Optional[float]: Seconds until reset, or None if not rate limited
+            Optional[float]: Seconds until the next request is allowed, or None if not rate limited
         """
-        if user_id not in self.requests:
+        tokens = self._refill(user_id, time.monotonic())
+        if tokens >= 1.0:
             return None
 
-        user_requests = self.requests[user_id]
-        if not user_requests:
-            return None
-
-        oldest_request = min(user_requests)
-        reset_time = oldest_request + self.window_seconds
-        current_time = time.time()
-
-        return max(0, reset_time - current_time)
+        return (1.0 - tokens) / self.refill_per_second
 
 
 def rate_limit(max_requests: int = 10, window_seconds: int = 60) -> Callable:
@@ -225,18 +303,20 @@ def rate_limit(max_requests: int = 10, window_seconds: int = 60) -> Callable:
         Callable: Decorator function
     """
     limiter = RateLimiter(max_requests, window_seconds)
+    is_allowed = limiter.is_allowed
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-            if not update.effective_user:
+            user = update.effective_user
+            if not user:
                 return
 
-            user_id = update.effective_user.id
+            user_id = user.id
 
-            if not limiter.is_allowed(user_id):
+            if not is_allowed(user_id):
                 reset_time = limiter.get_reset_time(user_id)
-                _ = get_translator(update.effective_user.language_code)
+                _ = get_translator(user.language_code)
 
                 if reset_time:
                     message = f"Rate limit exceeded. Please wait {int(reset_time)} seconds."
@@ -274,116 +354,120 @@ def retry(
     """
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            last_exception = None
-            delay = delay_seconds
-
-            for attempt in range(max_attempts):
-                try:
-                    if asyncio.iscoroutinefunction(func):
-                        return await func(*args, **kwargs)
-                    else:
-                        return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
+        # Only the wrapper matching the function type is built, and the type
+        # check happens once here rather than on every attempt
+        if asyncio.iscoroutinefunction(func):
 
-                    if attempt == max_attempts - 1:
-                        # Last attempt failed, re-raise
-                        break
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                delay = delay_seconds
 
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
-                        f"Retrying in {delay}s"
-                    )
-
-                    await asyncio.sleep(delay)
-                    delay *= backoff_factor
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == max_attempts - 1:
+                            # Last attempt failed, re-raise without sleeping again
+                            logger.error(
+                                f"All {max_attempts} attempts failed for {func.__name__}: {e}"
+                            )
+                            raise
+
+                        logger.warning(
+                            f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: "
+                            f"{e}. Retrying in {delay}s"
+                        )
+
+                        await asyncio.sleep(delay)
+                        delay *= backoff_factor
 
-            # All attempts failed
-            logger.error(
-                f"All {max_attempts} attempts failed for {func.__name__}: {last_exception}"
-            )
-            raise last_exception
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            last_exception = None
             delay = delay_seconds
 
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-
                     if attempt == max_attempts - 1:
-                        # Last attempt failed, re-raise
-                        break
+                        # Last attempt failed, re-raise without sleeping again
+                        logger.error(
+                            f"All {max_attempts} attempts failed for {func.__name__}: {e}"
+                        )
+                        raise
 
                     logger.warning(
                         f"Attempt {attempt + 1}/{max_attempts} failed for {func.__name__}: {e}. "
                         f"Retrying in {delay}s"
                     )
 
+                    if _in_event_loop():
+                        warnings.warn(
+                            f"Retrying {func.__name__} with time.sleep blocks the running "
+                            "event loop; call it from a worker thread instead",
+                            RuntimeWarning,
+                            stacklevel=2,
+                        )
+
                     time.sleep(delay)
                     delay *= backoff_factor
 
-            # All attempts failed
-            logger.error(
-                f"All {max_attempts} attempts failed for {func.__name__}: {last_exception}"
-            )
-            raise last_exception
-
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
 
-def cache_result(ttl_seconds: int = 300) -> Callable:
+def _in_event_loop() -> bool:
+    """Check whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def cache_result(ttl_seconds: int = 300, maxsize: int = 1000) -> Callable:
     """
     Simple cache decorator for function results.
 
+    Results are kept in a bounded LRU cache with per-entry expiry. Calls with
+    unhashable arguments are passed through uncached.
+
     Args:
         ttl_seconds: Time to live for cached results
+        maxsize: Maximum number of cached results
 
     Returns:
         Callable: Decorator function
     """
 
     def decorator(func: Callable) -> Callable:
-        cache: Dict[str, tuple] = {}  # key -> (result, timestamp)
+        cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        missing = object()
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from arguments
-            cache_key = str(hash((args, tuple(sorted(kwargs.items())))))
-
-            now = time.time()
+            try:
+                # Keyword order doesn't matter, so kwargs are keyed as a frozenset
+                cache_key = (args, frozenset(kwargs.items())) if kwargs else args
+                result = cache.get(cache_key, missing)
+            except TypeError:
+                return func(*args, **kwargs)
 
-            # Check if we have a valid cached result
-            if cache_key in cache:
-                result, timestamp = cache[cache_key]
-                if now - timestamp < ttl_seconds:
-                    logger.debug(f"Cache hit for {func.__name__}")
-                    return result
+            if result is not missing:
+                logger.debug(f"Cache hit for {func.__name__}")
+                return result
 
-            # Compute result and cache it
+            # Compute result and cache it; the LRU entry is evicted when full
             result = func(*args, **kwargs)
-            cache[cache_key] = (result, now)
-
-            # Clean old entries periodically
-            if len(cache) > 1000:  # Prevent unbounded growth
-                cutoff_time = now - ttl_seconds
-                cache.clear()  # Simple cleanup - remove all
+            cache.set(cache_key, result)
 
             logger.debug(f"Cache miss for {func.__name__}")
             return result
 
+        wrapper.cache = cache
         return wrapper
 
     return decorator
@@ -418,3 +502,57 @@ def validate_update(func: Callable) -> Callable:
         return await func(update, context)
 
     return wrapper
+
+
+def telegram_handler(func: Callable) -> Callable:
+    """
+    Decorator fusing handle_telegram_errors, log_handler_call and validate_update.
+
+    Equivalent to stacking the three decorators in that order, but as a single
+    wrapper that reads the update's user and chat once instead of once per layer.
+
+    Args:
+        func: Telegram handler function to wrap
+
+    Returns:
+        Callable: Wrapped handler function
+    """
+    # Bound once here so the per-update path reads closure cells, not globals
+    name = func.__name__
+    is_enabled_for = logger.isEnabledFor
+    clock = time.monotonic
+
+    @functools.wraps(func)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        user = update.effective_user if update else None
+        try:
+            chat = update.effective_chat if update else None
+            if is_enabled_for(logging.INFO):
+                _log_call(name, user, chat, update.message if update else None)
+
+            start_time = clock()
+            try:
+                # Basic validation
+                if not update:
+                    logger.error("Received None update")
+                    return
+                if not user:
+                    logger.warning("Update has no effective_user")
+                    return
+                if not chat:
+                    logger.warning("Update has no effective_chat")
+                    return
+
+                result = await func(update, context)
+                if is_enabled_for(logging.DEBUG):
+                    logger.debug(f"Handler {name} completed in {clock() - start_time:.3f}s")
+                return result
+            except Exception as e:
+                duration = clock() - start_time
+                logger.error(f"Handler {name} failed after {duration:.3f}s: {e}")
+                raise
+        except Exception as e:
+            logger.error(f"Error in {name}: {e}", exc_info=True)
+            _send_error_reply(update, user)
+
+    return wrapper
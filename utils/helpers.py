@@ -0,0 +1,127 @@
+"""
+Helper Utilities Module
+
+This module provides small general-purpose helpers shared by the services.
+
+Classes:
+    TTLCache: Bounded LRU cache with per-entry expiry
+
+Functions:
+    json_loads: Parse JSON, using orjson when installed
+    json_dumps: Serialize to a JSON string, using orjson when installed
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "speedups" extra
+    orjson = None
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    When the cache is full, only the least recently used entry is evicted.
+    Access is guarded by a lock so the cache can be shared with executor threads.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize TTL cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl_seconds: Time to live for each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key
+            default: Value to return on a miss
+
+        Returns:
+            Any: Cached value, or default if missing or expired
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires_at = item
+                if time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Get number of entries currently stored (including not yet purged expired ones)."""
+        return len(self._data)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Any: Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize a value to a compact JSON string, using orjson when it is installed.
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -9,10 +9,13 @@ Functions:
 """
 
 import logging
+from functools import lru_cache
 from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANGUAGE = "en"
+
 
 def get_translator(language_code: Optional[str] = None) -> Callable[[str], str]:
     """
@@ -21,9 +24,27 @@ def get_translator(language_code: Optional[str] = None) -> Callable[[str], str]:
     For now, this is a simple pass-through function that returns text as-is.
     In the future, this can be enhanced with proper gettext support.
 
+    Translators are cached per base language, so regional variants such as
+    'it-IT' share the 'it' translator and nothing is rebuilt per update.
+
     Args:
         language_code: ISO language code (e.g., 'it', 'en', 'de')
 
+    Returns:
+        Callable[[str], str]: Translator function
+    """
+    language = (language_code or DEFAULT_LANGUAGE).replace("_", "-").split("-")[0].lower()
+    return _load_translator(language)
+
+
+@lru_cache(maxsize=64)
+def _load_translator(language: str) -> Callable[[str], str]:
+    """
+    Build the translator for a normalized base language code.
+
+    Args:
+        language: Lowercase base language code (e.g., 'it')
+
     Returns:
         Callable[[str], str]: Translator function
     """
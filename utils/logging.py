@@ -5,15 +5,34 @@ This module provides centralized logging configuration for the application.
 It sets up structured logging with appropriate formatters and handlers
 based on the environment.
 
+Classes:
+    JSONFormatter: One-line JSON formatter for production logs
+    LoggerMixin: Mixin adding a logger property to any class
+
 Functions:
     setup_logging: Configure application logging
+    stop_logging: Flush queued records and stop the background log writer
     get_logger: Get a configured logger for a module
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
+
+from utils.helpers import json_dumps
+
+# Background thread that writes queued log records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Log file rotation and write batching
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 5
+LOG_FILE_BUFFER_CAPACITY = 200
 
 
 def setup_logging(
@@ -25,7 +44,10 @@ def setup_logging(
     Configure application logging with appropriate formatters and handlers.
 
     Sets up console logging with colored output for development and
-    structured logging for production environments.
+    structured logging for production environments. Loggers only enqueue
+    records; a background thread does the actual console and file writes,
+    so logging never blocks the event loop on I/O. The log file is rotated
+    by size and written in batches, flushed immediately for errors.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -43,7 +65,8 @@ def setup_logging(
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
 
-    # Clear existing handlers
+    # Clear existing handlers, flushing any previously queued records first
+    stop_logging()
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
 
@@ -53,12 +76,7 @@ def setup_logging(
     # Create formatters
     if environment == "production":
         # Structured format for production
-        formatter = logging.Formatter(
-            fmt='{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"module": "%(name)s", "message": "%(message)s", '
-            '"function": "%(funcName)s", "line": %(lineno)d}',
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
+        formatter = JSONFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
     else:
         # Human-readable format for development
         formatter = logging.Formatter(
@@ -70,23 +88,45 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(numeric_level)
-    root_logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
     # File handler (optional)
+    file_error = None
     if log_file:
         try:
             # Ensure log directory exists
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler = RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True,
+            )
             file_handler.setFormatter(formatter)
-            file_handler.setLevel(numeric_level)
-            root_logger.addHandler(file_handler)
 
-            root_logger.info(f"File logging enabled: {log_file}")
+            # Buffer records so bursts become a few large writes
+            buffered_handler = MemoryHandler(
+                LOG_FILE_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+            buffered_handler.setLevel(numeric_level)
+            handlers.append(buffered_handler)
         except Exception as e:
-            root_logger.warning(f"Failed to setup file logging: {e}")
+            file_error = e
+
+    # Route records through a queue to a background writer thread
+    global _queue_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_TracebackQueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    if file_error is not None:
+        root_logger.warning(f"Failed to setup file logging: {file_error}")
+    elif log_file:
+        root_logger.info(f"File logging enabled: {log_file}")
 
     # Configure third-party loggers
     _configure_third_party_loggers(environment)
@@ -97,6 +137,94 @@ def setup_logging(
     return root_logger
 
 
+class _TracebackQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps a record's traceback separate from its message.
+
+    The stock QueueHandler merges the traceback into the message before
+    enqueueing, which would leave JSONFormatter nothing to put in its
+    exception field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Render the message and traceback to text so the record can cross threads.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            logging.LogRecord: Copy of the record with message and exc_text filled in
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as one JSON object per line.
+
+    Fields are serialized with a JSON encoder rather than interpolated into a
+    JSON-looking template, so quotes and backslashes in messages stay valid.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as a JSON line.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            str: JSON-encoded record
+        """
+        data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "module": record.name,
+            "message": record.getMessage(),
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+
+        return json_dumps(data)
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records and stop the background log writer.
+
+    Buffered file records are written out and the log file is closed.
+    Safe to call more than once; it is also run automatically at interpreter exit.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            if isinstance(handler, MemoryHandler):
+                # close() flushes and then drops the target, so grab it first
+                target = handler.target
+                handler.close()
+                if target is not None:
+                    target.close()
+        _queue_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def _configure_third_party_loggers(environment: str) -> None:
     """
     Configure third-party library loggers to reduce noise.
@@ -133,16 +261,21 @@ class LoggerMixin:
     """
     Mixin class to add logging capability to any class.
 
+    The logger is looked up once per subclass, when the class is defined,
+    so self.logger is a plain class attribute read.
+
     Usage:
         class MyClass(LoggerMixin):
             def some_method(self):
                 self.logger.info("Something happened")
     """
 
-    @property
-    def logger(self) -> logging.Logger:
-        """Get logger for this class."""
-        return logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+    logger: logging.Logger
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Attach the logger for this class."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
 
 
 # Custom logging decorator
@@ -184,13 +317,21 @@ from contextlib import contextmanager
 
 
 @contextmanager
-def log_performance(operation_name: str, logger: Optional[logging.Logger] = None):
+def log_performance(
+    operation_name: str,
+    logger: Optional[logging.Logger] = None,
+    threshold_ms: float = 1.0,
+):
     """
     Context manager to log performance of operations.
 
+    Operations faster than the threshold are not logged, so wrapping hot
+    paths (e.g. cache hits) doesn't pay for record formatting and dispatch.
+
     Args:
         operation_name: Name of the operation being timed
         logger: Optional logger instance
+        threshold_ms: Minimum duration in milliseconds for the timing to be logged
 
     Usage:
         with log_performance("database_query", logger):
@@ -198,12 +339,14 @@ def log_performance(operation_name: str, logger: Optional[logging.Logger] = None
             pass
     """
     perf_logger = logger or logging.getLogger("performance")
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
-    perf_logger.debug(f"Starting {operation_name}")
+    if perf_logger.isEnabledFor(logging.DEBUG):
+        perf_logger.debug(f"Starting {operation_name}")
 
     try:
         yield
     finally:
-        duration = time.time() - start_time
-        perf_logger.info(f"{operation_name} completed in {duration:.3f}s")
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        if elapsed_ns >= threshold_ms * 1_000_000:
+            perf_logger.info(f"{operation_name} completed in {elapsed_ns / 1e9:.3f}s")